@@ -6,7 +6,6 @@ import os
 import sys
 import curses
 import time
-import humanize
 
 # Import extracted modules
 from lib.theme import THEMES, apply_theme, load_theme_cache, save_theme_cache
@@ -27,7 +26,7 @@ from lib.tui_draw import (
 )
 
 # Import other lib utilities
-from lib.utils import open_file_explorer
+from lib.utils import open_file_explorer, naturalsize_cached
 from lib.file_operations import (
     delete_item,
     copy_item,
@@ -82,6 +81,10 @@ def curses_main(stdscr):
             du_cache.shutdown()
             break
 
+        if ch == curses.ERR:
+            # getch timed out with no key pressed; skip the key comparisons below
+            continue
+
         if ch == ord('q') or ch == ord('Q'):
             du_cache.shutdown()
             break
@@ -197,7 +200,7 @@ def curses_main(stdscr):
                 status_msg = "⚠️ No files found."
                 status_msg_time = time.time()
             else:
-                options = [f"{humanize.naturalsize(f[2]):<10} │ {f[1]} ({f[5]})" for f in files]
+                options = [f"{naturalsize_cached(f[2]):<10} │ {f[1]} ({f[5]})" for f in files]
                 def draw_bg():
                     draw_screen(stdscr, current_dir, items, selected_idx, scroll_offset, spinner_frame, status_msg)
                 
@@ -222,7 +225,7 @@ def curses_main(stdscr):
                 status_msg = "✅ No duplicates found."
                 status_msg_time = time.time()
             else:
-                options = [f"{humanize.naturalsize(d['wasted']):<10} wasted │ {d['count']} files of {humanize.naturalsize(d['size'])}" for d in dups]
+                options = [f"{naturalsize_cached(d['wasted']):<10} wasted │ {d['count']} files of {naturalsize_cached(d['size'])}" for d in dups]
                 def draw_bg():
                     draw_screen(stdscr, current_dir, items, selected_idx, scroll_offset, spinner_frame, status_msg)
                 
@@ -249,19 +252,19 @@ def curses_main(stdscr):
 
         elif ch in [ord('w'), ord('W')]: # Wipe System Cache / temp folders
             cache_folders = scan_cache_folders()
-            options = [f"{humanize.naturalsize(c[3]):<10} │ {c[2]} ({c[0]})" for c in cache_folders]
+            options = [f"{naturalsize_cached(c[3]) + ('+' if c[5] else ''):<10} │ {c[2]} ({c[0]})" for c in cache_folders]
             def draw_bg():
                 draw_screen(stdscr, current_dir, items, selected_idx, scroll_offset, spinner_frame, status_msg)
             
             sel_idx = show_modal_list(stdscr, "System Cache Cleaner", options, draw_bg)
             if sel_idx is not None:
                 folder_info = cache_folders[sel_idx]
-                path, name, desc, size, _ = folder_info
+                path, name, desc, size, _, _ = folder_info
                 confirm = get_string_input(stdscr, f"Clear all files in {name}? Type 'yes':")
                 if confirm.lower() == "yes":
                     success, msg, freed = clear_folder(path)
                     if success:
-                        status_msg = f"✅ Freed {humanize.naturalsize(freed)}: {msg}"
+                        status_msg = f"✅ Freed {naturalsize_cached(freed)}: {msg}"
                         items = du_cache.scan_directory_tree(current_dir)
                     else:
                         status_msg = f"❌ Error: {msg}"
@@ -507,7 +510,7 @@ def curses_main(stdscr):
                     total_saved += saved_bytes
                     
             if compressed_count > 0:
-                status_msg = f"✅ Done! Compressed {compressed_count}/{total_images} images. Saved {humanize.naturalsize(total_saved)}."
+                status_msg = f"✅ Done! Compressed {compressed_count}/{total_images} images. Saved {naturalsize_cached(total_saved)}."
                 items = du_cache.scan_directory_tree(current_dir)
             else:
                 status_msg = "ℹ️ Done. Original files were already smaller than compressed versions."
@@ -521,7 +524,9 @@ def print_exit_message():
     """Prints a beautiful, colored goodbye message upon exit."""
     try:
         from colorama import Fore, Style, init
-        init(autoreset=True)
+        # Every line below resets its own colors; the wrapper is only needed to
+        # convert codes on Windows or strip them when stdout is not a terminal
+        init(wrap=sys.platform == 'win32' or not sys.stdout.isatty())
         print(f"\n{Fore.GREEN}{Style.BRIGHT}Thanks for using DiskMan V4!{Style.RESET_ALL}")
         print(f"{Fore.CYAN}Made with ❤️  by {Fore.YELLOW}{Style.BRIGHT}SamSeen{Style.RESET_ALL}")
         print(f"{Fore.MAGENTA}☕ If you found this useful: {Fore.BLUE}{Style.BRIGHT}https://buymeacoffee.com/samseen{Style.RESET_ALL}\n")
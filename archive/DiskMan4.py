@@ -47,6 +47,7 @@ from lib.utils import (
 from lib.file_operations import (
     list_directory_cached,
     delete_item,
+    delete_items,
     get_item_details,
     remove_from_cache,
     copy_item,
@@ -756,8 +757,8 @@ def main():
                         item_details.append(details)
                 
                 if item_details and show_delete_confirmation(item_details, use_trash=True):
-                    for details in item_details:
-                        success, msg = delete_item(details['path'], use_trash=True)
+                    results = delete_items([details['path'] for details in item_details], use_trash=True)
+                    for details, (success, msg) in zip(item_details, results):
                         if success:
                             print(f"{Fore.GREEN}✓ {details['name']}: {msg}{Style.RESET_ALL}")
                             remove_from_cache(details['path'])
@@ -779,8 +780,8 @@ def main():
                         item_details.append(details)
                 
                 if item_details and show_delete_confirmation(item_details, use_trash=False):
-                    for details in item_details:
-                        success, msg = delete_item(details['path'], use_trash=False)
+                    results = delete_items([details['path'] for details in item_details], use_trash=False)
+                    for details, (success, msg) in zip(item_details, results):
                         if success:
                             print(f"{Fore.GREEN}✓ {details['name']}: {msg}{Style.RESET_ALL}")
                             remove_from_cache(details['path'])
@@ -922,7 +923,7 @@ def main():
                     input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
                 elif action[0] == 'clear':
                     folder_info = action[1]
-                    path, name, desc, size, _ = folder_info
+                    path, name, desc, size, _, _ = folder_info
                     
                     print(f"\n{Fore.RED}{Style.BRIGHT}⚠️  CLEAR FOLDER CONTENTS{Style.RESET_ALL}")
                     print(f"{Fore.YELLOW}Folder: {path}{Style.RESET_ALL}")
@@ -7,7 +7,6 @@ A powerful tool to visualize and manage disk space usage with advanced features.
 import os
 import sys
 import time
-import humanize
 from colorama import Fore, Style
 
 __version__ = "3.0.10"
@@ -19,13 +18,19 @@ from lib.utils import (
     clear_screen,
     optimize_terminal_view,
     get_optimal_display_settings,
-    detect_terminal
+    detect_terminal,
+    fast_naturalsize
 )
 from lib.file_operations import (
     list_directory_cached,
     delete_item,
+    delete_items,
     get_item_details,
+    details_from_item,
+    prefetch_listings,
+    is_directory,
     remove_from_cache,
+    remove_from_cache_many,
     invalidate_cache,
     copy_item,
     move_item,
@@ -36,6 +41,8 @@ from lib.file_operations import (
 from lib.ui import (
     display_directory,
     show_navigation_options,
+    prefetch_page,
+    read_command,
     show_welcome_message,
     show_delete_confirmation,
     show_extension_stats,
@@ -56,10 +63,457 @@ from lib.bookmarks import (
     list_bookmarks
 )
 
-try:
-    import readline
-except ImportError:
-    pass
+# Color prefixes for result lines, built once instead of per printed item
+_OK = f"{Fore.GREEN}✓ "
+_FAIL = f"{Fore.RED}✗ "
+_RESET = Style.RESET_ALL
+_PROMPT = f"\n{Fore.CYAN}> {Fore.YELLOW}"
+
+
+def _pause():
+    input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
+
+
+class _State:
+    """Mutable state shared by the interactive command handlers."""
+
+    def __init__(self, current_dir, items_per_page, cache):
+        self.current_dir = current_dir
+        self.current_page = 0
+        self.items_per_page = items_per_page
+        self.cache = cache
+        self.items = []
+        self.total_items = 0
+        self.total_pages = 0
+        self.paged_by = None  # items_per_page total_pages was computed for
+        self.force_rescan = False
+        self.running = True
+        self.dir_verified = False  # current_dir confirmed to exist since it was entered
+        self.drawn_view = None  # view settings of the listing currently on screen
+
+    def go_to(self, path):
+        self.current_dir = path
+        self.current_page = 0
+        self.dir_verified = False
+
+
+def _open_or_goto(state, action):
+    """Handle the 'goto'/'open' actions returned by the result screens."""
+    if action[0] == 'goto':
+        state.go_to(action[1])
+    elif action[0] == 'open':
+        open_file_explorer(action[1], os.path.basename(action[1]))
+        _pause()
+
+
+# --- QUIT ---
+def _cmd_quit(state, arg):
+    print(f"\n{Fore.GREEN}{Style.BRIGHT}Thanks for using DiskMan V3!{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}Made with ❤️  by SamSeen{Style.RESET_ALL}")
+    print(f"{Fore.YELLOW}☕ If you found this useful: {Fore.WHITE}https://buymeacoffee.com/samseen{Style.RESET_ALL}\n")
+    state.running = False
+
+
+# --- HELP ---
+def _cmd_help(state, arg):
+    show_help()
+
+
+# --- RESCAN ---
+def _cmd_rescan(state, arg):
+    state.force_rescan = True
+
+
+# --- HOME ---
+def _cmd_home(state, arg):
+    state.go_to(os.path.expanduser("~"))
+
+
+# --- TOGGLE HIDDEN ---
+def _cmd_toggle_hidden(state, arg):
+    # Refresh view without rescan
+    state.cache.toggle_hidden()
+
+
+# --- SORT CYCLE ---
+def _cmd_cycle_sort(state, arg):
+    state.cache.cycle_sort()
+
+
+# --- FILTER ---
+def _cmd_filter(state, choice):
+    filter_text = choice[1:].strip() if len(choice) > 1 else None
+    state.cache.set_filter(filter_text if filter_text else None)
+    state.current_page = 0
+
+
+# --- DEEP SEARCH ---
+def _cmd_search(state, arg):
+    search_text = arg.strip()
+    if search_text:
+        results = state.cache.search_files(search_text)
+        scan_root = state.cache.get_scan_root() or state.current_dir
+        action = show_search_results(results, search_text, scan_root)
+        if action:
+            _open_or_goto(state, action)
+
+
+# --- ITEMS PER PAGE ---
+def _cmd_items_per_page(state, choice):
+    new_limit = int(choice[1:].strip())
+    if 5 <= new_limit <= 50:
+        state.items_per_page = new_limit
+        state.current_page = 0
+    else:
+        print(f"\n{Fore.RED}Limit must be 5-50{Style.RESET_ALL}")
+        _pause()
+
+
+# --- GO TO SCAN ROOT ---
+def _cmd_scan_root(state, arg):
+    scan_root = state.cache.get_scan_root()
+    if scan_root and is_directory(scan_root):
+        state.go_to(scan_root)
+    else:
+        print(f"\n{Fore.YELLOW}No cached scan root available{Style.RESET_ALL}")
+        _pause()
+
+
+# --- GO UP ---
+def _cmd_up(state, choice):
+    levels = 1
+    suffix = choice[2:]
+    if suffix == '':
+        levels = 1
+    elif suffix.isdigit():
+        levels = int(suffix)
+    elif suffix.startswith('/') and suffix[1:].isdigit():
+        levels = int(suffix[1:])
+    elif suffix.startswith('.'):
+        levels = len(choice) - 1
+    
+    new_dir = state.current_dir
+    for _ in range(levels):
+        parent = os.path.dirname(new_dir)
+        if parent == new_dir:
+            break
+        new_dir = parent
+    
+    if new_dir != state.current_dir:
+        state.go_to(new_dir)
+
+
+# --- GO TO DIRECTORY ---
+def _cmd_goto(state, arg):
+    target = arg.strip()
+    if is_directory(target):
+        state.go_to(os.path.abspath(target))
+    else:
+        print(f"\n{Fore.RED}Not found: {target}{Style.RESET_ALL}")
+        _pause()
+
+
+# --- PAGINATION ---
+def _cmd_next_page(state, arg):
+    if state.current_page < state.total_pages - 1:
+        state.current_page += 1
+    else:
+        _cmd_unknown(state, arg)
+
+
+def _cmd_prev_page(state, arg):
+    if state.current_page > 0:
+        state.current_page -= 1
+    else:
+        _cmd_unknown(state, arg)
+
+
+# --- OPEN IN FINDER ---
+def _cmd_open(state, arg):
+    indices = parse_selection(arg.strip(), state.total_items)
+    if indices:
+        name = state.items[indices[0]][0]
+        item_path = os.path.join(state.current_dir, name)
+        open_file_explorer(item_path, name)
+        _pause()
+
+
+# --- DELETE (to Trash) / PERMANENT DELETE ---
+def _delete_selection(state, arg, use_trash):
+    indices = parse_selection(arg.strip(), state.total_items)
+    if indices:
+        item_details = [details_from_item(state.items[idx], state.current_dir) for idx in indices]
+        
+        if item_details and show_delete_confirmation(item_details, use_trash=use_trash):
+            results = delete_items([details['path'] for details in item_details], use_trash=use_trash)
+            deleted = []
+            out = []
+            for details, (success, msg) in zip(item_details, results):
+                if success:
+                    out.append(f"{_OK}{details['name']}: {msg}{_RESET}\n")
+                    deleted.append(details['path'])
+                else:
+                    out.append(f"{_FAIL}{details['name']}: {msg}{_RESET}\n")
+            sys.stdout.write(''.join(out))
+            remove_from_cache_many(deleted)
+            _pause()
+
+
+def _cmd_delete(state, arg):
+    _delete_selection(state, arg, use_trash=True)
+
+
+def _cmd_delete_permanent(state, arg):
+    _delete_selection(state, arg, use_trash=False)
+
+
+# --- MOVE / COPY ---
+def _transfer_selection(state, arg, move):
+    parts = arg.strip().split(' ', 1)
+    if len(parts) == 2:
+        sel, dest = parts
+        indices = parse_selection(sel, state.total_items)
+        if indices and is_directory(dest):
+            moved = []
+            prefix = os.path.join(state.current_dir, '')
+            for idx in indices:
+                name = state.items[idx][0]
+                path = prefix + name
+                if move:
+                    success, result = move_item(path, dest)
+                else:
+                    success, result = copy_item(path, dest)
+                if success:
+                    print(f"{_OK}{'Moved' if move else 'Copied'} {name}{_RESET}")
+                    if move:
+                        moved.append(path)
+                else:
+                    print(f"{_FAIL}{name}: {result}{_RESET}")
+            remove_from_cache_many(moved)
+            _pause()
+        else:
+            print(f"{Fore.RED}Invalid destination.{Style.RESET_ALL}")
+            _pause()
+
+
+def _cmd_move(state, arg):
+    _transfer_selection(state, arg, move=True)
+
+
+def _cmd_copy(state, arg):
+    _transfer_selection(state, arg, move=False)
+
+
+# --- EXTENSION STATS ---
+def _cmd_extension_stats(state, arg):
+    stats = state.cache.get_extension_stats(state.current_dir)
+    show_extension_stats(stats, stats.total)
+
+
+# --- BOOKMARKS ---
+def _cmd_bookmarks(state, choice):
+    if choice == 'b':
+        # Show bookmarks
+        bm_list = list_bookmarks()
+        bm_choice = show_bookmarks(bm_list)
+        if bm_choice.startswith('b') and bm_choice[1:].isdigit():
+            path = get_bookmark(int(bm_choice[1:]))
+            if path and is_directory(path):
+                state.go_to(path)
+    elif choice == 'b+':
+        success, msg = add_bookmark(state.current_dir)
+        print(f"{Fore.GREEN if success else Fore.RED}{msg}{Style.RESET_ALL}")
+        _pause()
+    elif choice.startswith('b-') and choice[2:].strip().isdigit():
+        idx = int(choice[2:].strip())
+        success, msg = remove_bookmark(idx)
+        print(f"{Fore.GREEN if success else Fore.RED}{msg}{Style.RESET_ALL}")
+        _pause()
+    elif choice[1:].isdigit():
+        idx = int(choice[1:])
+        path = get_bookmark(idx)
+        if path and is_directory(path):
+            state.go_to(path)
+        else:
+            print(f"{Fore.RED}Invalid bookmark.{Style.RESET_ALL}")
+            _pause()
+
+
+# --- EXPORT ---
+def _cmd_export(state, arg):
+    success, result = export_report(state.current_dir, state.items)
+    if success:
+        print(f"\n{_OK}Exported to: {result}{_RESET}")
+    else:
+        print(f"\n{Fore.RED}Export failed: {result}{Style.RESET_ALL}")
+    _pause()
+
+
+# --- DUPLICATES ---
+def _cmd_duplicates(state, arg):
+    dups = state.cache.find_duplicates(state.current_dir)
+    action = show_duplicates(dups)
+    if action:
+        _open_or_goto(state, action)
+
+
+# --- LARGEST FILES (BigTree functionality) ---
+def _cmd_top(state, arg):
+    # Parse optional limit (default 20)
+    limit = 20
+    if arg.strip().isdigit():
+        limit = min(100, int(arg.strip()))
+    
+    files = state.cache.get_largest_files(limit=limit)
+    scan_root = state.cache.get_scan_root() or state.current_dir
+    action = show_largest_files(files, scan_root)
+    
+    if action:
+        if action[0] == 'delete':
+            details = get_item_details(action[1])
+            if details and show_delete_confirmation(details, use_trash=True):
+                success, msg = delete_item(action[1], use_trash=True)
+                if success:
+                    print(f"{_OK}Deleted: {os.path.basename(action[1])}{_RESET}")
+                    remove_from_cache(action[1])
+                else:
+                    print(f"{_FAIL}{msg}{_RESET}")
+                _pause()
+        else:
+            _open_or_goto(state, action)
+
+
+# --- SYSTEM CACHE CLEANER ---
+def _cmd_clean(state, arg):
+    cache_folders = scan_cache_folders()
+    action = show_cache_cleaner(cache_folders)
+    
+    if action:
+        if action[0] == 'clear':
+            folder_info = action[1]
+            path, name, desc, size, _, _ = folder_info
+            
+            # Confirm clear
+            print(f"\n{Fore.RED}{Style.BRIGHT}⚠️  CLEAR FOLDER CONTENTS{Style.RESET_ALL}")
+            print(f"{Fore.YELLOW}Folder: {path}{Style.RESET_ALL}")
+            print(f"{Fore.WHITE}Size: {fast_naturalsize(size)}{Style.RESET_ALL}")
+            print(f"\n{Fore.RED}This will delete ALL contents of this folder!{Style.RESET_ALL}")
+            confirm = input(f"{Fore.RED}Type 'yes' to confirm: {Style.RESET_ALL}").strip().lower()
+            
+            if confirm == 'yes':
+                success, msg, freed = clear_folder(path)
+                if success:
+                    print(f"\n{_OK}{msg} - Freed {fast_naturalsize(freed)}{_RESET}")
+                    if freed > 100 * 1024 * 1024:  # > 100MB freed
+                        print(f"{Fore.YELLOW}☕ Glad DiskMan helped! Support: {Fore.WHITE}buymeacoffee.com/samseen{Style.RESET_ALL}")
+                else:
+                    print(f"\n{_FAIL}{msg}{_RESET}")
+                _pause()
+        else:
+            _open_or_goto(state, action)
+
+
+# --- WEB DASHBOARD ---
+def _cmd_web(state, arg):
+    # Parse optional port
+    port = 5001
+    if arg.strip().isdigit():
+        port = int(arg.strip())
+    
+    from lib.web_server import start_dashboard
+    
+    print(f"\n{Fore.GREEN}🌐 Starting DiskMan Dashboard...{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}Opening: {Fore.WHITE}http://localhost:{port}{Style.RESET_ALL}")
+    print(f"{Fore.YELLOW}Press Ctrl+C to stop and return to CLI{Style.RESET_ALL}\n")
+    
+    try:
+        start_dashboard(state.cache, state.current_dir, port=port)
+    except KeyboardInterrupt:
+        pass
+    print(f"\n{Fore.GREEN}Dashboard stopped. Returning to CLI...{Style.RESET_ALL}")
+    _pause()
+
+
+# --- NAVIGATE TO ITEM ---
+def _cmd_navigate(state, choice):
+    idx = int(choice) - 1
+    if 0 <= idx < state.total_items:
+        name, _, is_dir, _, _ = state.items[idx]
+        if is_dir:
+            state.go_to(os.path.join(state.current_dir, name))
+        else:
+            # Show file preview
+            file_path = os.path.join(state.current_dir, name)
+            preview = get_file_preview(file_path)
+            show_file_preview(preview, file_path)
+    else:
+        print(f"\n{Fore.RED}Invalid selection.{Style.RESET_ALL}")
+        _pause()
+
+
+def _cmd_unknown(state, arg):
+    print(f"\n{Fore.RED}Unknown command.{Style.RESET_ALL}")
+    _pause()
+
+
+# Commands matched against the whole input
+_COMMANDS = {
+    'q': _cmd_quit,
+    '?': _cmd_help,
+    'help': _cmd_help,
+    'r': _cmd_rescan,
+    '~': _cmd_home,
+    'h': _cmd_toggle_hidden,
+    's': _cmd_cycle_sort,
+    '.': _cmd_scan_root,
+    'n': _cmd_next_page,
+    'p': _cmd_prev_page,
+    'e': _cmd_extension_stats,
+    'x': _cmd_export,
+    'dup': _cmd_duplicates,
+    'top': _cmd_top,
+    'clean': _cmd_clean,
+    'web': _cmd_web,
+}
+
+# Commands taking an argument after the first space, e.g. "d 1-3"
+_ARG_COMMANDS = {
+    'F': _cmd_search,
+    '/': _cmd_search,
+    'g': _cmd_goto,
+    'o': _cmd_open,
+    'd': _cmd_delete,
+    'D': _cmd_delete_permanent,
+    'm': _cmd_move,
+    'c': _cmd_copy,
+    'top': _cmd_top,
+    'web': _cmd_web,
+}
+
+
+def _dispatch(state, choice):
+    """Run the handler for one line of input."""
+    handler = _COMMANDS.get(choice)
+    if handler is not None:
+        return handler(state, '')
+    
+    cmd, _, arg = choice.partition(' ')
+    handler = _ARG_COMMANDS.get(cmd)
+    if handler is not None and arg.strip():
+        return handler(state, arg)
+    
+    # Commands written without a space, e.g. "fpy", "l30", "..2", "b3", "12"
+    if choice.startswith('f'):
+        return _cmd_filter(state, choice)
+    if choice.startswith('l') and choice[1:].strip().isdigit():
+        return _cmd_items_per_page(state, choice)
+    if choice.startswith('..'):
+        return _cmd_up(state, choice)
+    if choice.startswith('b'):
+        return _cmd_bookmarks(state, choice)
+    if choice.isdigit():
+        return _cmd_navigate(state, choice)
+    return _cmd_unknown(state, choice)
 
 
 def main():
@@ -74,6 +528,12 @@ def main():
         show_help()
         return
 
+    # Line editing for the prompts; only needed once we go interactive
+    try:
+        import readline
+    except ImportError:
+        pass
+
     # Auto-update check
     from lib.updater import check_for_updates
     update_available = check_for_updates()
@@ -132,7 +592,7 @@ def main():
         # 2. CLEANER
         elif command == 'clean':
             print(f"{Fore.CYAN}Starting System Cleaner...{Style.RESET_ALL}")
-            show_cache_cleaner()
+            show_cache_cleaner(scan_cache_folders())
             return
 
         # 3. DIRECT ACTION COMMANDS (dup, top, f)
@@ -186,7 +646,7 @@ def main():
                     if details and show_delete_confirmation(details, use_trash=True):
                         success, msg = delete_item(path, use_trash=True)
                         if success:
-                            print(f"{Fore.GREEN}✓ Deleted: {os.path.basename(path)}{Style.RESET_ALL}")
+                            print(f"{_OK}Deleted: {os.path.basename(path)}{_RESET}")
                             # Force rescan since we deleted something
                             # Since we fall through to while True loop:
                             # We can set force_rescan=True if we can access it?
@@ -194,7 +654,7 @@ def main():
                             # We need to make sure delete invalidates cache properly.
                             remove_from_cache(path)
                         else:
-                            print(f"{Fore.RED}✗ {msg}{Style.RESET_ALL}")
+                            print(f"{_FAIL}{msg}{_RESET}")
             
             # FALL THROUGH TO INTERACTIVE MODE
             # We removed the 'else: return' and 'return' statements.
@@ -218,421 +678,65 @@ def main():
             current_dir = show_welcome_message(version=__version__, update_available=update_available)
     
     # State
-    current_page = 0
-    force_rescan = False
-    cache = get_cache()
-
-    while True:
-        # Validate directory
-        if not os.path.isdir(current_dir):
-            print(f"{Fore.RED}Directory not found: {current_dir}{Style.RESET_ALL}")
-            current_dir = os.path.expanduser("~")
-            current_page = 0
-            force_rescan = True
+    state = _State(current_dir, items_per_page, get_cache())
+
+    while state.running:
+        # Validate directory, only after navigating or when a rescan was asked for;
+        # paging, sorting and filtering keep the directory we already checked
+        if not state.dir_verified or state.force_rescan:
+            if not is_directory(state.current_dir):
+                print(f"{Fore.RED}Directory not found: {state.current_dir}{Style.RESET_ALL}")
+                state.go_to(os.path.expanduser("~"))
+                state.force_rescan = True
+            state.dir_verified = True
 
         # Get directory contents
-        items, is_cached = list_directory_cached(current_dir, force_rescan=force_rescan)
-        force_rescan = False
-
-        # Pagination
-        total_items = len(items)
-        total_pages = (total_items + items_per_page - 1) // items_per_page
-        current_page = max(0, min(current_page, total_pages - 1)) if total_pages > 0 else 0
-
-        # Display
-        display_directory(
-            current_dir, items, current_page, items_per_page,
-            is_cached=is_cached,
-            sort_mode=cache.sort_mode,
-            show_hidden=cache.show_hidden,
-            filter_text=cache.filter_text
-        )
-        
-        show_navigation_options(current_page, total_pages, cache.show_hidden, cache.sort_mode)
+        items, is_cached = list_directory_cached(state.current_dir, force_rescan=state.force_rescan)
+        state.force_rescan = False
+
+        # Pagination; the cache hands back the same list while nothing changed
+        if items is not state.items or state.paged_by != state.items_per_page:
+            state.items = items
+            state.paged_by = state.items_per_page
+            state.total_items = len(items)
+            state.total_pages = (state.total_items + state.items_per_page - 1) // state.items_per_page
+        state.current_page = max(0, min(state.current_page, state.total_pages - 1)) if state.total_pages > 0 else 0
+
+        # Display, unless the same view is still on screen from the last pass
+        cache = state.cache
+        view = (state.current_dir, state.current_page, state.items_per_page,
+                cache.sort_mode, cache.show_hidden, cache.filter_text, id(state.items))
+        if view != state.drawn_view:
+            display_directory(
+                state.current_dir, state.items, state.current_page, state.items_per_page,
+                is_cached=is_cached,
+                sort_mode=cache.sort_mode,
+                show_hidden=cache.show_hidden,
+                filter_text=cache.filter_text
+            )
+            
+            show_navigation_options(state.current_page, state.total_pages, cache.show_hidden, cache.sort_mode)
+
+            # Format the next page and prepare the likely next listings while waiting for input
+            prefetch_page(state.items, state.current_page + 1, state.items_per_page)
+            start = state.current_page * state.items_per_page
+            prefix = os.path.join(state.current_dir, '')
+            prefetch_listings(
+                [os.path.dirname(state.current_dir)] +
+                [prefix + item[0] for item in state.items[start:start + state.items_per_page] if item[2]]
+            )
+            state.drawn_view = view
 
         # Get input
-        choice = input(f"\n{Fore.CYAN}> {Fore.YELLOW}").strip()
+        choice = read_command(_PROMPT).strip()
         print(f"{Style.RESET_ALL}", end="")
 
         if not choice:
             continue
 
-        # --- QUIT ---
-        if choice == 'q':
-            print(f"\n{Fore.GREEN}{Style.BRIGHT}Thanks for using DiskMan V3!{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}Made with ❤️  by SamSeen{Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}☕ If you found this useful: {Fore.WHITE}https://buymeacoffee.com/samseen{Style.RESET_ALL}\n")
-            break
-
-        # --- HELP ---
-        elif choice == '?' or choice == 'help':
-            show_help()
-
-        # --- RESCAN ---
-        elif choice == 'r':
-            force_rescan = True
-
-        # --- HOME ---
-        elif choice == '~':
-            current_dir = os.path.expanduser("~")
-            current_page = 0
-
-        # --- TOGGLE HIDDEN ---
-        elif choice == 'h':
-            new_state = cache.toggle_hidden()
-            # Refresh view without rescan
-            continue
-
-        # --- SORT CYCLE ---
-        elif choice == 's':
-            new_mode = cache.cycle_sort()
-            continue
-
-        # --- FILTER ---
-        elif choice.startswith('f') and not choice.startswith('F'):
-            filter_text = choice[1:].strip() if len(choice) > 1 else None
-            cache.set_filter(filter_text if filter_text else None)
-            current_page = 0
-            continue
-
-        # --- DEEP SEARCH ---
-        elif choice.startswith('F ') or choice.startswith('/ '):
-            search_text = choice[2:].strip()
-            if search_text:
-                results = cache.search_files(search_text)
-                scan_root = cache.get_scan_root() or current_dir
-                action = show_search_results(results, search_text, scan_root)
-                if action:
-                    if action[0] == 'goto':
-                        current_dir = action[1]
-                        current_page = 0
-                    elif action[0] == 'open':
-                        open_file_explorer(action[1], os.path.basename(action[1]))
-                        input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        # --- ITEMS PER PAGE ---
-        elif choice.startswith('l') and choice[1:].strip().isdigit():
-            new_limit = int(choice[1:].strip())
-            if 5 <= new_limit <= 50:
-                items_per_page = new_limit
-                current_page = 0
-            else:
-                print(f"\n{Fore.RED}Limit must be 5-50{Style.RESET_ALL}")
-                input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-            continue
-
-        # --- GO TO SCAN ROOT ---
-        elif choice == '.':
-            scan_root = cache.get_scan_root()
-            if scan_root and os.path.isdir(scan_root):
-                current_dir = scan_root
-                current_page = 0
-            else:
-                print(f"\n{Fore.YELLOW}No cached scan root available{Style.RESET_ALL}")
-                input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        # --- GO UP ---
-        elif choice.startswith('..'):
-            levels = 1
-            suffix = choice[2:]
-            if suffix == '':
-                levels = 1
-            elif suffix.isdigit():
-                levels = int(suffix)
-            elif suffix.startswith('/') and suffix[1:].isdigit():
-                levels = int(suffix[1:])
-            elif suffix.startswith('.'):
-                levels = len(choice) - 1
-            
-            new_dir = current_dir
-            for _ in range(levels):
-                parent = os.path.dirname(new_dir)
-                if parent == new_dir:
-                    break
-                new_dir = parent
-            
-            if new_dir != current_dir:
-                current_dir = new_dir
-                current_page = 0
-
-        # --- GO TO DIRECTORY ---
-        elif choice.startswith('g '):
-            target = choice[2:].strip()
-            if os.path.isdir(target):
-                current_dir = os.path.abspath(target)
-                current_page = 0
-            else:
-                print(f"\n{Fore.RED}Not found: {target}{Style.RESET_ALL}")
-                input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        # --- PAGINATION ---
-        elif choice == 'n' and current_page < total_pages - 1:
-            current_page += 1
-        elif choice == 'p' and current_page > 0:
-            current_page -= 1
-
-        # --- OPEN IN FINDER ---
-        elif choice.startswith('o ') and choice[2:].strip():
-            sel = choice[2:].strip()
-            indices = parse_selection(sel, total_items)
-            if indices:
-                idx = indices[0]
-                name = items[idx][0]
-                item_path = os.path.join(current_dir, name)
-                open_file_explorer(item_path, name)
-                input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        # --- DELETE (to Trash) ---
-        elif choice.startswith('d ') and choice[2:].strip():
-            sel = choice[2:].strip()
-            indices = parse_selection(sel, total_items)
-            if indices:
-                item_details = []
-                for idx in indices:
-                    name = items[idx][0]
-                    path = os.path.join(current_dir, name)
-                    details = get_item_details(path)
-                    if details:
-                        item_details.append(details)
-                
-                if item_details and show_delete_confirmation(item_details, use_trash=True):
-                    for details in item_details:
-                        success, msg = delete_item(details['path'], use_trash=True)
-                        if success:
-                            print(f"{Fore.GREEN}✓ {details['name']}: {msg}{Style.RESET_ALL}")
-                            remove_from_cache(details['path'])
-                        else:
-                            print(f"{Fore.RED}✗ {details['name']}: {msg}{Style.RESET_ALL}")
-                    force_rescan = True
-                    input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        # --- PERMANENT DELETE ---
-        elif choice.startswith('D ') and choice[2:].strip():
-            sel = choice[2:].strip()
-            indices = parse_selection(sel, total_items)
-            if indices:
-                item_details = []
-                for idx in indices:
-                    name = items[idx][0]
-                    path = os.path.join(current_dir, name)
-                    details = get_item_details(path)
-                    if details:
-                        item_details.append(details)
-                
-                if item_details and show_delete_confirmation(item_details, use_trash=False):
-                    for details in item_details:
-                        success, msg = delete_item(details['path'], use_trash=False)
-                        if success:
-                            print(f"{Fore.GREEN}✓ {details['name']}: {msg}{Style.RESET_ALL}")
-                            remove_from_cache(details['path'])
-                        else:
-                            print(f"{Fore.RED}✗ {details['name']}: {msg}{Style.RESET_ALL}")
-                    force_rescan = True
-                    input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        # --- MOVE ---
-        elif choice.startswith('m '):
-            parts = choice[2:].strip().split(' ', 1)
-            if len(parts) == 2:
-                sel, dest = parts
-                indices = parse_selection(sel, total_items)
-                if indices and os.path.isdir(dest):
-                    for idx in indices:
-                        name = items[idx][0]
-                        path = os.path.join(current_dir, name)
-                        success, result = move_item(path, dest)
-                        if success:
-                            print(f"{Fore.GREEN}✓ Moved {name}{Style.RESET_ALL}")
-                            remove_from_cache(path)
-                        else:
-                            print(f"{Fore.RED}✗ {name}: {result}{Style.RESET_ALL}")
-                    force_rescan = True
-                    input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-                else:
-                    print(f"{Fore.RED}Invalid destination.{Style.RESET_ALL}")
-                    input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        # --- COPY ---
-        elif choice.startswith('c '):
-            parts = choice[2:].strip().split(' ', 1)
-            if len(parts) == 2:
-                sel, dest = parts
-                indices = parse_selection(sel, total_items)
-                if indices and os.path.isdir(dest):
-                    for idx in indices:
-                        name = items[idx][0]
-                        path = os.path.join(current_dir, name)
-                        success, result = copy_item(path, dest)
-                        if success:
-                            print(f"{Fore.GREEN}✓ Copied {name}{Style.RESET_ALL}")
-                        else:
-                            print(f"{Fore.RED}✗ {name}: {result}{Style.RESET_ALL}")
-                    input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-                else:
-                    print(f"{Fore.RED}Invalid destination.{Style.RESET_ALL}")
-                    input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        # --- EXTENSION STATS ---
-        elif choice == 'e':
-            stats = cache.get_extension_stats(current_dir)
-            total = sum(stats.values())
-            show_extension_stats(stats, total)
-
-        # --- BOOKMARKS ---
-        elif choice.startswith('b'):
-            if choice == 'b':
-                # Show bookmarks
-                bm_list = list_bookmarks()
-                bm_choice = show_bookmarks(bm_list)
-                if bm_choice.startswith('b') and bm_choice[1:].isdigit():
-                    path = get_bookmark(int(bm_choice[1:]))
-                    if path and os.path.isdir(path):
-                        current_dir = path
-                        current_page = 0
-            elif choice == 'b+':
-                success, msg = add_bookmark(current_dir)
-                print(f"{Fore.GREEN if success else Fore.RED}{msg}{Style.RESET_ALL}")
-                input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-            elif choice.startswith('b-') and choice[2:].strip().isdigit():
-                idx = int(choice[2:].strip())
-                success, msg = remove_bookmark(idx)
-                print(f"{Fore.GREEN if success else Fore.RED}{msg}{Style.RESET_ALL}")
-                input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-            elif choice[1:].isdigit():
-                idx = int(choice[1:])
-                path = get_bookmark(idx)
-                if path and os.path.isdir(path):
-                    current_dir = path
-                    current_page = 0
-                else:
-                    print(f"{Fore.RED}Invalid bookmark.{Style.RESET_ALL}")
-                    input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        # --- EXPORT ---
-        elif choice == 'x':
-            success, result = export_report(current_dir, items)
-            if success:
-                print(f"\n{Fore.GREEN}✓ Exported to: {result}{Style.RESET_ALL}")
-            else:
-                print(f"\n{Fore.RED}Export failed: {result}{Style.RESET_ALL}")
-            input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        # --- DUPLICATES ---
-        elif choice == 'dup':
-            dups = cache.find_duplicates(current_dir)
-            action = show_duplicates(dups)
-            if action:
-                if action[0] == 'goto':
-                    current_dir = action[1]
-                    current_page = 0
-                elif action[0] == 'open':
-                    open_file_explorer(action[1], os.path.basename(action[1]))
-                    input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        # --- LARGEST FILES (BigTree functionality) ---
-        elif choice == 'top' or choice.startswith('top '):
-            # Parse optional limit (default 20)
-            limit = 20
-            if choice.startswith('top ') and choice[4:].strip().isdigit():
-                limit = min(100, int(choice[4:].strip()))
-            
-            files = cache.get_largest_files(limit=limit)
-            scan_root = cache.get_scan_root() or current_dir
-            action = show_largest_files(files, scan_root)
-            
-            if action:
-                if action[0] == 'goto':
-                    current_dir = action[1]
-                    current_page = 0
-                elif action[0] == 'open':
-                    open_file_explorer(action[1], os.path.basename(action[1]))
-                    input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-                elif action[0] == 'delete':
-                    details = get_item_details(action[1])
-                    if details and show_delete_confirmation(details, use_trash=True):
-                        success, msg = delete_item(action[1], use_trash=True)
-                        if success:
-                            print(f"{Fore.GREEN}✓ Deleted: {os.path.basename(action[1])}{Style.RESET_ALL}")
-                            remove_from_cache(action[1])
-                            force_rescan = True
-                        else:
-                            print(f"{Fore.RED}✗ {msg}{Style.RESET_ALL}")
-                        input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        # --- SYSTEM CACHE CLEANER ---
-        elif choice == 'clean':
-            cache_folders = scan_cache_folders()
-            action = show_cache_cleaner(cache_folders)
-            
-            if action:
-                if action[0] == 'goto':
-                    current_dir = action[1]
-                    current_page = 0
-                    force_rescan = True
-                elif action[0] == 'open':
-                    open_file_explorer(action[1], os.path.basename(action[1]))
-                    input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-                elif action[0] == 'clear':
-                    folder_info = action[1]
-                    path, name, desc, size, _ = folder_info
-                    
-                    # Confirm clear
-                    print(f"\n{Fore.RED}{Style.BRIGHT}⚠️  CLEAR FOLDER CONTENTS{Style.RESET_ALL}")
-                    print(f"{Fore.YELLOW}Folder: {path}{Style.RESET_ALL}")
-                    print(f"{Fore.WHITE}Size: {humanize.naturalsize(size)}{Style.RESET_ALL}")
-                    print(f"\n{Fore.RED}This will delete ALL contents of this folder!{Style.RESET_ALL}")
-                    confirm = input(f"{Fore.RED}Type 'yes' to confirm: {Style.RESET_ALL}").strip().lower()
-                    
-                    if confirm == 'yes':
-                        success, msg, freed = clear_folder(path)
-                        if success:
-                            print(f"\n{Fore.GREEN}✓ {msg} - Freed {humanize.naturalsize(freed)}{Style.RESET_ALL}")
-                            if freed > 100 * 1024 * 1024:  # > 100MB freed
-                                print(f"{Fore.YELLOW}☕ Glad DiskMan helped! Support: {Fore.WHITE}buymeacoffee.com/samseen{Style.RESET_ALL}")
-                        else:
-                            print(f"\n{Fore.RED}✗ {msg}{Style.RESET_ALL}")
-                        input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        # --- WEB DASHBOARD ---
-        elif choice == 'web' or choice.startswith('web '):
-            # Parse optional port
-            port = 5001
-            if choice.startswith('web ') and choice[4:].strip().isdigit():
-                port = int(choice[4:].strip())
-            
-            from lib.web_server import start_dashboard
-            
-            print(f"\n{Fore.GREEN}🌐 Starting DiskMan Dashboard...{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}Opening: {Fore.WHITE}http://localhost:{port}{Style.RESET_ALL}")
-            print(f"{Fore.YELLOW}Press Ctrl+C to stop and return to CLI{Style.RESET_ALL}\n")
-            
-            try:
-                start_dashboard(cache, current_dir, port=port)
-            except KeyboardInterrupt:
-                pass
-            print(f"\n{Fore.GREEN}Dashboard stopped. Returning to CLI...{Style.RESET_ALL}")
-            input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        # --- NAVIGATE TO ITEM ---
-        elif choice.isdigit():
-            idx = int(choice) - 1
-            if 0 <= idx < total_items:
-                name, _, is_dir, _, _ = items[idx]
-                if is_dir:
-                    current_dir = os.path.join(current_dir, name)
-                    current_page = 0
-                else:
-                    # Show file preview
-                    file_path = os.path.join(current_dir, name)
-                    preview = get_file_preview(file_path)
-                    show_file_preview(preview, file_path)
-            else:
-                print(f"\n{Fore.RED}Invalid selection.{Style.RESET_ALL}")
-                input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
-
-        else:
-            print(f"\n{Fore.RED}Unknown command.{Style.RESET_ALL}")
-            input(f"{Fore.CYAN}Press Enter...{Style.RESET_ALL}")
+        # Handlers may print over the listing, so redraw after any command
+        state.drawn_view = None
+        _dispatch(state, choice)
 
 
 if __name__ == "__main__":
@@ -1,24 +1,47 @@
-import requests
-import hashlib
+import gzip
+import http.client
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+PACKAGES = [
+    ("colorama", "0.4.6"),
+    ("humanize", "4.9.0"),
+    ("Send2Trash", "1.8.2"),
+]
+
+# http.client connections are not thread-safe; each worker keeps its own alive
+# across the lookups it handles
+_local = threading.local()
+
+def _connection():
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = _local.conn = http.client.HTTPSConnection("pypi.org")
+    return conn
 
 def get_package_data(package, version):
-    url = f"https://pypi.org/pypi/{package}/{version}/json"
-    response = requests.get(url)
-    if response.status_code != 200:
-        print(f"Error fetching {package}: {response.status_code}")
-        return
+    """Return the Homebrew resource block for a package's sdist, or an error line."""
+    conn = _connection()
+    conn.request("GET", f"/pypi/{package}/{version}/json", headers={"Accept-Encoding": "gzip"})
+    response = conn.getresponse()
+    body = response.read()
+    if response.status != 200:
+        return f"Error fetching {package}: {response.status}"
 
-    data = response.json()
+    if response.getheader("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    data = json.loads(body)
     for release in data['urls']:
         if release['packagetype'] == 'sdist':
-            print(f'  resource "{package}" do')
-            print(f'    url "{release["url"]}"')
-            print(f'    sha256 "{release["digests"]["sha256"]}"')
-            print('  end\n')
-            return
-    print(f"No sdist found for {package}")
+            return (f'  resource "{package}" do\n'
+                    f'    url "{release["url"]}"\n'
+                    f'    sha256 "{release["digests"]["sha256"]}"\n'
+                    '  end\n')
+    return f"No sdist found for {package}"
 
 print("# Dependencies")
-get_package_data("colorama", "0.4.6")
-get_package_data("humanize", "4.9.0")
-get_package_data("Send2Trash", "1.8.2")
+# The lookups only wait on the network, so run them together and print in order
+with ThreadPoolExecutor(max_workers=len(PACKAGES)) as pool:
+    for block in pool.map(lambda pv: get_package_data(*pv), PACKAGES):
+        print(block)
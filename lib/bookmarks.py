@@ -1,43 +1,85 @@
 #!/usr/bin/env python3
 """
 Bookmarks system for DiskMan V3.
+
+Bookmarks are read once and kept in memory until the file's mtime changes,
+so lookups between edits cost a single stat. Edits are written through right
+away rather than at exit, so other DiskMan processes see them and a crash
+does not lose them.
 """
 import os
 import json
 
+# orjson is optional; it parses and writes the file faster than the json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 BOOKMARKS_FILE = os.path.expanduser('~/.diskman_bookmarks.json')
 
+# Last loaded bookmarks, the same paths as a set for membership tests, and the
+# file mtime they were read at: (mtime_ns, bookmarks, bookmark_set)
+_loaded = (None, [], frozenset())
 
-def load_bookmarks():
-    """Load bookmarks from file."""
+
+def _load_cached():
+    """Return (bookmarks, bookmark_set) as last read; callers must not modify them.
+    
+    The parsed list is kept and reused while the file's mtime is unchanged, so
+    repeated lookups cost one stat instead of a read and a JSON parse.
+    """
+    global _loaded
+    try:
+        mtime_ns = os.stat(BOOKMARKS_FILE).st_mtime_ns
+    except OSError:
+        return [], frozenset()
+    if _loaded[0] == mtime_ns:
+        return _loaded[1], _loaded[2]
     try:
-        if os.path.exists(BOOKMARKS_FILE):
+        if orjson is not None:
+            with open(BOOKMARKS_FILE, 'rb') as f:
+                bookmarks = orjson.loads(f.read())
+        else:
             with open(BOOKMARKS_FILE, 'r') as f:
-                return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        pass
-    return []
+                bookmarks = json.load(f)
+    except (ValueError, IOError):
+        return [], frozenset()
+    _loaded = (mtime_ns, bookmarks, frozenset(bookmarks))
+    return _loaded[1], _loaded[2]
+
+
+def load_bookmarks():
+    """Load bookmarks from file."""
+    return list(_load_cached()[0])
 
 
 def save_bookmarks(bookmarks):
     """Save bookmarks to file."""
+    global _loaded
     try:
-        with open(BOOKMARKS_FILE, 'w') as f:
-            json.dump(bookmarks, f, indent=2)
+        if orjson is not None:
+            with open(BOOKMARKS_FILE, 'wb') as f:
+                f.write(orjson.dumps(bookmarks, option=orjson.OPT_INDENT_2))
+        else:
+            with open(BOOKMARKS_FILE, 'w') as f:
+                json.dump(bookmarks, f, indent=2)
+        _loaded = (os.stat(BOOKMARKS_FILE).st_mtime_ns, list(bookmarks), frozenset(bookmarks))
         return True
     except IOError:
+        _loaded = (None, [], frozenset())
         return False
 
 
 def add_bookmark(path):
     """Add a directory to bookmarks."""
-    bookmarks = load_bookmarks()
+    bookmarks, bookmark_set = _load_cached()
     abs_path = os.path.abspath(path)
     
-    if abs_path in bookmarks:
+    if abs_path in bookmark_set:
         return False, "Already bookmarked"
     
-    bookmarks.append(abs_path)
+    bookmarks = bookmarks + [abs_path]
     if save_bookmarks(bookmarks):
         return True, f"Bookmark #{len(bookmarks)} added"
     return False, "Failed to save bookmark"
@@ -56,7 +98,7 @@ def remove_bookmark(index):
 
 def get_bookmark(index):
     """Get bookmark path by index (1-based)."""
-    bookmarks = load_bookmarks()
+    bookmarks = _load_cached()[0]
     
     if 1 <= index <= len(bookmarks):
         return bookmarks[index - 1]
@@ -65,5 +107,5 @@ def get_bookmark(index):
 
 def list_bookmarks():
     """Get all bookmarks with their indices."""
-    bookmarks = load_bookmarks()
+    bookmarks = _load_cached()[0]
     return [(i + 1, path) for i, path in enumerate(bookmarks)]
@@ -4,9 +4,330 @@ Enhanced directory cache for DiskMan V3.
 Provides efficient caching with filtering, sorting, and analysis capabilities.
 """
 import os
+import stat
+import sys
 import hashlib
-from datetime import datetime, timedelta
-from .utils import is_hidden, start_spinner, stop_spinner, update_spinner_folder
+import heapq
+import pickle
+import threading
+import time
+from itertools import compress
+from operator import itemgetter
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from .utils import is_hidden, start_spinner, stop_spinner, update_spinner_folder, abspath_cached
+
+# Number of threads used to read directories during a deep scan; the walk waits
+# on the filesystem rather than the CPU, so it runs several threads per core
+SCAN_WORKERS = min(32, (os.cpu_count() or 2) * 4)
+# Only fan out to the thread pool once this many directories are waiting
+PARALLEL_THRESHOLD = 4
+# Most directory reads queued on the scan pool at once; the rest wait in the frontier
+MAX_PENDING_DIRS = 512
+# Entries per batch when a single directory listing is streamed
+STREAM_CHUNK = 256
+# Finished deep scans are saved in the user's cache directory, one file per root,
+# so the next run can start from them and only rescan directories that changed in
+# between. Saving straight into ~ would change the mtime of a scan root of ~ itself
+if sys.platform == 'darwin':
+    SNAPSHOT_DIR = os.path.expanduser('~/Library/Caches/DiskMan')
+elif os.name == 'nt':
+    SNAPSHOT_DIR = os.path.join(os.environ.get('LOCALAPPDATA') or os.path.expanduser('~'), 'DiskMan', 'Cache')
+else:
+    SNAPSHOT_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'diskman')
+# Directory mtimes do not change when a file is rewritten in place, so older
+# snapshots are not trusted at all
+SNAPSHOT_MAX_AGE = 24 * 60 * 60
+SNAPSHOT_VERSION = 1
+# Age thresholds in seconds for get_age_color
+OLD_AGE = 365 * 24 * 60 * 60
+MEDIUM_AGE = 90 * 24 * 60 * 60
+
+
+# Where supported, directories are read through an fd so each entry's stat is an
+# fstatat() relative to it instead of a fresh lookup of the full path
+_SCANDIR_FD = os.scandir in os.supports_fd and os.stat in os.supports_dir_fd
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+
+
+# Windows keeps a hidden attribute in the directory entry itself
+_HIDDEN_ATTRIBUTE = getattr(stat, 'FILE_ATTRIBUTE_HIDDEN', 0) if os.name == 'nt' else 0
+
+
+def _entry_hidden(entry):
+    """Hidden check from a DirEntry: a leading dot, or the Windows hidden attribute.
+    
+    On Windows the entry's stat comes from the directory read, so unlike
+    utils.is_hidden this costs no extra lookup of the path.
+    """
+    if entry.name.startswith('.'):
+        return True
+    if _HIDDEN_ATTRIBUTE:
+        try:
+            return bool(entry.stat(follow_symlinks=False).st_file_attributes & _HIDDEN_ATTRIBUTE)
+        except OSError:
+            pass
+    return False
+
+
+def _scan_dir(dirpath):
+    """Read a single directory.
+    
+    Returns (dirpath, mtime_ns, entries, subdirs) where mtime_ns stamps the directory
+    as it was read, entries is a list of (name, path, is_dir, size, mtime, hidden)
+    and subdirs lists child directories to descend into.
+    """
+    entries = []
+    subdirs = []
+    prefix = os.path.join(dirpath, '')
+    mtime_ns = None
+    fd = None
+    try:
+        if _SCANDIR_FD:
+            # Stamp the directory through the fd it is read from, saving a path lookup
+            fd = os.open(dirpath, _DIR_OPEN_FLAGS)
+            mtime_ns = os.fstat(fd).st_mtime_ns
+        else:
+            mtime_ns = os.stat(dirpath).st_mtime_ns
+        with os.scandir(dirpath if fd is None else fd) as it:
+            for entry in it:
+                item_path = prefix + entry.name
+                hidden = _entry_hidden(entry)
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        entries.append((entry.name, item_path, True, 0, 0, hidden))
+                        subdirs.append(item_path)
+                    elif entry.is_symlink():
+                        # Listed but never followed
+                        entries.append((entry.name, item_path, entry.is_dir(), 0, 0, hidden))
+                    else:
+                        st = entry.stat(follow_symlinks=False)
+                        entries.append((entry.name, item_path, False, st.st_size, st.st_mtime, hidden))
+                except (OSError, PermissionError):
+                    entries.append((entry.name, item_path, False, 0, 0, hidden))
+    except (OSError, PermissionError):
+        pass
+    finally:
+        if fd is not None:
+            os.close(fd)
+    return dirpath, mtime_ns, entries, subdirs
+
+
+def scandir_stream(path, chunk=STREAM_CHUNK, cancel=None):
+    """Yield a directory's entries in lists of up to chunk os.DirEntry objects.
+    
+    Stops without reading the rest of the directory once cancel (a
+    threading.Event) is set. Errors opening the directory propagate.
+    """
+    batch = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if cancel is not None and cancel.is_set():
+                return
+            batch.append(entry)
+            if len(batch) >= chunk:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def _parallel_walk(root, workers=SCAN_WORKERS):
+    """Walk the tree under root, yielding (dirpath, mtime_ns, entries) for every directory.
+    
+    Directories are read sequentially until more than PARALLEL_THRESHOLD are
+    waiting, then the rest of the walk fans out over a thread pool (scandir and
+    stat release the GIL), with at most MAX_PENDING_DIRS reads queued at a time.
+    workers=1 keeps the whole walk sequential.
+    """
+    frontier = [root]
+    while frontier and (workers <= 1 or len(frontier) <= PARALLEL_THRESHOLD):
+        dirpath, mtime_ns, entries, subdirs = _scan_dir(frontier.pop())
+        yield dirpath, mtime_ns, entries
+        frontier.extend(subdirs)
+    
+    if not frontier:
+        return
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        while frontier or pending:
+            # Keep the pool fed without queueing a future for every directory of a wide tree
+            while frontier and len(pending) < MAX_PENDING_DIRS:
+                pending.add(pool.submit(_scan_dir, frontier.pop()))
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                dirpath, mtime_ns, entries, subdirs = future.result()
+                yield dirpath, mtime_ns, entries
+                frontier.extend(subdirs)
+
+
+# xxhash is optional; its XXH3 digests are several times faster than any hashlib
+# algorithm, and either is far stronger than needed to tell files apart
+try:
+    import xxhash
+    _new_digest = xxhash.xxh3_128
+except ImportError:
+    _new_digest = hashlib.blake2b
+
+# Duplicate candidates are split by a hash of their first PROBE_BYTES, then by their
+# first and last FINGERPRINT_BYTES; a full-content hash is only computed for files
+# larger than the fingerprint whose fingerprints still collide
+PROBE_BYTES = 4096
+FINGERPRINT_BYTES = 64 * 1024
+HASH_CHUNK = 1024 * 1024
+_HASH_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+
+def _open_for_hash(path):
+    """Open a file for reading without touching its access time where allowed."""
+    if _NOATIME:
+        try:
+            return os.open(path, _HASH_OPEN_FLAGS | _NOATIME)
+        except PermissionError:
+            # O_NOATIME is refused on files we do not own
+            pass
+    return os.open(path, _HASH_OPEN_FLAGS)
+
+
+# Each hashing thread reads into one buffer of its own instead of allocating per read
+_buffers = threading.local()
+
+
+def _read_buffer():
+    """Return this thread's reusable HASH_CHUNK read buffer as a memoryview."""
+    view = getattr(_buffers, 'view', None)
+    if view is None:
+        view = _buffers.view = memoryview(bytearray(HASH_CHUNK))
+    return view
+
+
+def _read_into(fd, view, offset):
+    """Read into view from offset in fd, returning the number of bytes read."""
+    if hasattr(os, 'preadv'):
+        return os.preadv(fd, [view], offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    with open(fd, 'rb', buffering=0, closefd=False) as f:
+        return f.readinto(view) or 0
+
+
+def _probe(path):
+    """Hash the first PROBE_BYTES of a file."""
+    view = _read_buffer()
+    fd = _open_for_hash(path)
+    try:
+        n = _read_into(fd, view[:PROBE_BYTES], 0)
+    finally:
+        os.close(fd)
+    return _new_digest(view[:n]).digest()
+
+
+def _fingerprint(path, size):
+    """Hash the head and tail of a file; for small files this covers all of it."""
+    view = _read_buffer()
+    fd = _open_for_hash(path)
+    try:
+        if size <= 2 * FINGERPRINT_BYTES:
+            n = _read_into(fd, view[:size], 0)
+        else:
+            n = _read_into(fd, view[:FINGERPRINT_BYTES], 0)
+            n += _read_into(fd, view[n:n + FINGERPRINT_BYTES], size - FINGERPRINT_BYTES)
+    finally:
+        os.close(fd)
+    return _new_digest(view[:n]).digest()
+
+
+def _full_hash(path):
+    """Hash the complete contents of a file, reading it sequentially into the thread's buffer."""
+    digest = _new_digest()
+    view = _read_buffer()
+    fd = _open_for_hash(path)
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        with open(fd, 'rb', buffering=0, closefd=False) as f:
+            while True:
+                n = f.readinto(view)
+                if not n:
+                    break
+                digest.update(view[:n])
+    finally:
+        os.close(fd)
+    return digest.digest()
+
+
+def _split_groups(groups, key, pool):
+    """Split (size, paths) groups by key(path, size), keeping the parts that still hold several paths.
+    
+    The keys of every path in every group are computed together on pool, so
+    reads from different groups overlap. Unreadable files are skipped.
+    """
+    jobs = [(i, path, size) for i, (size, paths) in enumerate(groups) for path in paths]
+    
+    def job_key(job):
+        try:
+            return key(job[1], job[2])
+        except (OSError, PermissionError):
+            return None
+    
+    parts = {}
+    for (i, path, _), k in zip(jobs, pool.map(job_key, jobs)):
+        if k is not None:
+            parts.setdefault((i, k), []).append(path)
+    return [(groups[i][0], paths) for (i, _), paths in parts.items() if len(paths) > 1]
+
+
+def _extension(name):
+    """Lowercase extension of a file name, or 'no extension'.
+    
+    Same result as os.path.splitext: a dot only starts an extension when
+    something other than dots comes before it.
+    """
+    head, dot, tail = name.rpartition('.')
+    return (dot + tail).lower() if head.strip('.') else 'no extension'
+
+
+def _snapshot_path(root):
+    """Snapshot file for a scan root, named by a hash of the root path."""
+    key = hashlib.sha1(os.fsencode(root)).hexdigest()
+    return os.path.join(SNAPSHOT_DIR, key + '.pickle')
+
+
+def _write_snapshot(path, data):
+    """Atomically replace a snapshot file with pickled data; failures are ignored."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(SNAPSHOT_DIR, mode=0o700, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        _prune_snapshots()
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _prune_snapshots():
+    """Delete snapshots too old to be loaded again."""
+    cutoff = time.time() - SNAPSHOT_MAX_AGE
+    with os.scandir(SNAPSHOT_DIR) as it:
+        for entry in it:
+            try:
+                if entry.name.endswith('.pickle') and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+
+class ExtensionStats(dict):
+    """{extension: total_size} mapping that also carries the sum of its sizes."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.total = sum(self.values())
 
 
 class DirectoryCache:
@@ -17,152 +338,702 @@ class DirectoryCache:
         self.cache = {}        # {directory_path: [(name, size, is_dir, is_hidden, mtime), ...]}
         self.sizes = {}        # {path: size}
         self.mtimes = {}       # {path: modification_time}
+        self.dir_mtimes_ns = {}  # {directory_path: st_mtime_ns when its listing was read}
+        self.parent = {}       # {directory_path: parent directory_path} for directories below the root
+        self._row_index = {}   # {directory_path: index of its row in the parent's listing}
+        self._reset_file_index()
+        self._views = {}       # {directory_path: (raw_items, view_settings, filtered_sorted_items)}
+        self._prepared = {}    # {directory_path: (view_settings, listing_copy, filtered_sorted_items)}
+        self._names = {}       # {directory_path: (raw_items, lowercase_names, '\n'-joined lowercase names)}
+        self._ext_totals = {}  # {directory_path: (raw_items, {extension: total size of its files})}
+        self._unverified = set()  # directories loaded from a snapshot whose file rows were not re-read
         self.show_hidden = True
         self.sort_mode = 'size'  # 'size', 'name', 'date'
         self.filter_text = None
+        self.scan_workers = SCAN_WORKERS
     
-    def scan_directory_tree(self, root_path):
-        """Deep scan from root, caching all directories with metadata."""
+    def scan_directory_tree(self, root_path, reuse_snapshot=False, save_snapshot=False):
+        """Deep scan from root, caching all directories with metadata.
+        
+        With reuse_snapshot, a recent snapshot of the same root saved by an
+        earlier run is loaded instead, and only directories whose mtime changed
+        since are rescanned. With save_snapshot, the resulting tree is saved as
+        the root's snapshot; the file is written in the background.
+        """
+        root = abspath_cached(root_path)
+        if reuse_snapshot and self._load_snapshot(root):
+            dirty = self.validate(root, max_depth=float('inf'))
+            for dirty_dir in dirty:
+                self.rescan_subtree(dirty_dir)
+            if dirty and save_snapshot:
+                self._save_snapshot()
+            self._restat_files(root)
+            return self._apply_filters_and_sort(self.cache.get(root, []))
+        
         self.cache = {}
         self.sizes = {}
         self.mtimes = {}
-        self.scan_root = os.path.abspath(root_path)
+        self.dir_mtimes_ns = {}
+        self.parent = {}
+        self._row_index = {}
+        self._reset_file_index()
+        self._views = {}
+        self._prepared = {}
+        self._names = {}
+        self._ext_totals = {}
+        self._unverified = set()
+        self.scan_root = abspath_cached(root_path)
         
         start_spinner(f"Deep scanning {os.path.basename(root_path)}...")
+        self._walk_subtree(self.scan_root)
+        self._indexed = True
+        if save_snapshot:
+            self._save_snapshot()
+        stop_spinner()
+        return self._apply_filters_and_sort(self.cache.get(self.scan_root, []))
+    
+    def _save_snapshot(self):
+        """Write the scanned tree to the root's snapshot file; failures are ignored.
         
-        dir_contents = {}
+        The tree is pickled here, since the listings are edited in place once
+        the caller moves on; writing the file happens on a background thread.
+        Returns that thread, or None if the tree could not be pickled.
+        """
+        path = _snapshot_path(self.scan_root)
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'root': self.scan_root,
+            'saved_at': time.time(),
+            'cache': self.cache,
+            'sizes': self.sizes,
+            'mtimes': self.mtimes,
+            'dir_mtimes_ns': self.dir_mtimes_ns,
+        }
+        try:
+            data = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, RecursionError):
+            return None
+        
+        thread = threading.Thread(target=_write_snapshot, args=(path, data), daemon=True)
+        thread.start()
+        return thread
+    
+    def _load_snapshot(self, root):
+        """Replace the cache with root's saved snapshot, returning whether one was usable.
         
+        The size index, parent pointers and row indices are not saved; they are
+        rebuilt from the loaded listings, which needs no filesystem access.
+        """
         try:
-            for dirpath, dirnames, filenames in os.walk(self.scan_root):
-                # Update spinner with current folder
-                update_spinner_folder(dirpath)
-                
-                dir_contents[dirpath] = []
-                
-                for filename in filenames:
-                    file_path = os.path.join(dirpath, filename)
-                    try:
-                        if not os.path.islink(file_path):
-                            stat = os.stat(file_path)
-                            self.sizes[file_path] = stat.st_size
-                            self.mtimes[file_path] = stat.st_mtime
-                        else:
-                            self.sizes[file_path] = 0
-                            self.mtimes[file_path] = 0
-                    except (OSError, PermissionError):
-                        self.sizes[file_path] = 0
-                        self.mtimes[file_path] = 0
-                    dir_contents[dirpath].append((filename, file_path, False))
-                
-                for dirname in dirnames:
-                    dir_path = os.path.join(dirpath, dirname)
-                    dir_contents[dirpath].append((dirname, dir_path, True))
-        except (OSError, PermissionError):
-            pass
+            with open(_snapshot_path(root), 'rb') as f:
+                snapshot = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+            return False
+        if (not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION
+                or snapshot.get('root') != root
+                or time.time() - snapshot.get('saved_at', 0) > SNAPSHOT_MAX_AGE):
+            return False
+        
+        self.invalidate()
+        self.scan_root = root
+        self.cache = snapshot['cache']
+        self.sizes = snapshot['sizes']
+        self.mtimes = snapshot['mtimes']
+        self.dir_mtimes_ns = snapshot['dir_mtimes_ns']
+        
+        files = []
+        for path, size in self.sizes.items():
+            if path not in self.cache:
+                self._index_file(size, path)
+                files.append((-size, path))
+        heapq.heapify(files)
+        self._file_heap = files
+        for dir_path, listing in self.cache.items():
+            self._index_rows(dir_path, listing)
+        self._unverified = set(self.cache)
+        self._indexed = True
+        return True
+    
+    def _restat_files(self, dir_path):
+        """Re-read the file rows of a listing that came from a snapshot.
+        
+        A file rewritten in place leaves its directory's mtime alone, so validate
+        cannot see it. Each snapshot listing has its files re-statted once, when
+        it is first opened, and any changed size is rolled up through the
+        ancestors.
+        """
+        if dir_path not in self._unverified:
+            return
+        self._unverified.discard(dir_path)
+        listing = self.cache.get(dir_path)
+        if not listing:
+            return
         
-        # Calculate directory sizes bottom-up
-        sorted_dirs = sorted(dir_contents.keys(), key=lambda x: x.count(os.sep), reverse=True)
+        prefix = os.path.join(dir_path, '')
+        delta = 0
+        changed = False
+        for i, (name, size, is_dir, is_hid, mtime) in enumerate(listing):
+            if is_dir:
+                continue
+            path = prefix + name
+            try:
+                st = os.lstat(path)
+            except OSError:
+                continue
+            # Symlinks are listed with no size of their own
+            if stat.S_ISLNK(st.st_mode) or (st.st_size == size and st.st_mtime == mtime):
+                continue
+            listing[i] = (name, st.st_size, is_dir, is_hid, st.st_mtime)
+            self.sizes[path] = st.st_size
+            self.mtimes[path] = st.st_mtime
+            if self._unindex_file(size, path):
+                self._stale_files += 1
+            self._index_file(st.st_size, path)
+            heapq.heappush(self._file_heap, (-st.st_size, path))
+            self.mtimes[dir_path] = max(self.mtimes.get(dir_path, 0), st.st_mtime)
+            delta += st.st_size - size
+            changed = True
+        
+        if changed:
+            self._forget_listing(dir_path)
+            if delta:
+                self._roll_up(dir_path, delta)
+            else:
+                self._update_row(dir_path)
+    
+    def _walk_subtree(self, root):
+        """Walk root and cache every directory beneath it, returning the root's total size."""
+        dir_contents = {}
+        new_files = []
         
-        for dirpath in sorted_dirs:
+        for dirpath, mtime_ns, entries in _parallel_walk(root, self.scan_workers):
+            # Update spinner with current folder
+            update_spinner_folder(dirpath)
+            
+            dir_contents[dirpath] = entries
+            if mtime_ns is not None:
+                self.dir_mtimes_ns[dirpath] = mtime_ns
+            
+            for name, item_path, is_dir, size, mtime, _ in entries:
+                if not is_dir:
+                    self.sizes[item_path] = size
+                    self.mtimes[item_path] = mtime
+                    self._index_file(size, item_path)
+                    new_files.append((-size, item_path))
+        
+        if self._file_heap:
+            for entry in new_files:
+                heapq.heappush(self._file_heap, entry)
+        else:
+            heapq.heapify(new_files)
+            self._file_heap = new_files
+        
+        # Calculate directory sizes bottom-up. The walk yields a directory before any
+        # of its subdirectories are read, so the reverse of that order visits every
+        # directory after all of its descendants, with no sort by depth
+        for dirpath in reversed(list(dir_contents)):
             dir_size = 0
             dir_mtime = 0
             items = []
             
-            for name, item_path, is_dir in dir_contents[dirpath]:
-                try:
-                    if is_dir:
-                        size = self.sizes.get(item_path, 0)
-                        mtime = self.mtimes.get(item_path, 0)
-                    else:
-                        size = self.sizes.get(item_path, 0)
-                        mtime = self.mtimes.get(item_path, 0)
-                    
-                    is_hidden_item = is_hidden(item_path)
-                    items.append((name, size, is_dir, is_hidden_item, mtime))
-                    dir_size += size
-                    dir_mtime = max(dir_mtime, mtime)
-                except (OSError, PermissionError):
-                    pass
+            for name, item_path, is_dir, _, _, is_hidden_item in dir_contents[dirpath]:
+                size = self.sizes.get(item_path, 0)
+                mtime = self.mtimes.get(item_path, 0)
+                items.append((name, size, is_dir, is_hidden_item, mtime))
+                dir_size += size
+                dir_mtime = max(dir_mtime, mtime)
             
             self.sizes[dirpath] = dir_size
             self.mtimes[dirpath] = dir_mtime
+            # Store listings largest first: the default size view (and any filtered
+            # subset of it) is then already in order, which list.sort checks in one pass
+            items.sort(key=itemgetter(1), reverse=True)
             self.cache[dirpath] = items
+            self._index_rows(dirpath, items)
+            self._forget_listing(dirpath)
+            self._unverified.discard(dirpath)
         
-        stop_spinner()
-        return self._apply_filters_and_sort(self.cache.get(self.scan_root, []))
+        return self.sizes.get(root, 0)
+    
+    def _index_rows(self, dir_path, listing):
+        """Record the parent and row position of every subdirectory in a listing."""
+        prefix = os.path.join(dir_path, '')
+        for i, item in enumerate(listing):
+            if item[2]:
+                child = prefix + item[0]
+                self.parent[child] = dir_path
+                self._row_index[child] = i
+    
+    def _forget_listing(self, dir_path):
+        """Drop views derived from a directory listing after it changed."""
+        self._views.pop(dir_path, None)
+        self._names.pop(dir_path, None)
+        self._ext_totals.pop(dir_path, None)
     
-    def _apply_filters_and_sort(self, items):
-        """Apply current filter and sort settings to items."""
+    def _lowercase_names(self, dir_path, raw_items):
+        """Return (lowercase_names, joined_blob) for a listing, built once per listing."""
+        entry = self._names.get(dir_path)
+        if entry is not None and entry[0] is raw_items:
+            return entry[1], entry[2]
+        lowered = [item[0].lower() for item in raw_items]
+        blob = '\n'.join(lowered)
+        self._names[dir_path] = (raw_items, lowered, blob)
+        return lowered, blob
+    
+    def _reset_file_index(self):
+        """Clear the size indexes used by get_largest_files and find_duplicates."""
+        self._by_size = {}       # {size: file_path, or set(file_paths) once two files share the size}
+        self._file_heap = []     # heap of (-size, path); removed files are dropped lazily
+        self._stale_files = 0
+        self._indexed = False    # only set once a full deep scan has filled the indexes
+    
+    def _index_file(self, size, path):
+        """Add a file to the size index.
+        
+        Most sizes belong to a single file, so a bucket holds the bare path
+        until a second file of that size appears; a one-element set per file
+        would cost several times the memory of the path itself.
+        """
+        bucket = self._by_size.get(size)
+        if bucket is None:
+            self._by_size[size] = path
+        elif isinstance(bucket, str):
+            if bucket != path:
+                self._by_size[size] = {bucket, path}
+        else:
+            bucket.add(path)
+    
+    def _unindex_file(self, size, path):
+        """Remove a file from the size index, returning whether it was there."""
+        bucket = self._by_size.get(size)
+        if bucket is None:
+            return False
+        if isinstance(bucket, str):
+            if bucket != path:
+                return False
+            del self._by_size[size]
+            return True
+        if path not in bucket:
+            return False
+        bucket.discard(path)
+        if len(bucket) == 1:
+            self._by_size[size] = bucket.pop()
+        return True
+    
+    def _iter_indexed_files(self):
+        """Yield (size, path) for every file in the size index."""
+        for size, bucket in self._by_size.items():
+            if isinstance(bucket, str):
+                yield size, bucket
+            else:
+                for path in bucket:
+                    yield size, path
+    
+    def _iter_largest_files(self):
+        """Yield (size, path) for cached files, largest first, without sorting every file."""
+        if self._stale_files > len(self._file_heap) // 2:
+            self._file_heap = [(-size, path) for size, path in self._iter_indexed_files()]
+            heapq.heapify(self._file_heap)
+            self._stale_files = 0
+        
+        heap = self._file_heap
+        if not heap:
+            return
+        seen = set()
+        frontier = [(heap[0], 0)]
+        while frontier:
+            (neg_size, path), i = heapq.heappop(frontier)
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+            if path in seen or self.sizes.get(path) != -neg_size or path in self.cache:
+                continue
+            seen.add(path)
+            yield -neg_size, path
+    
+    def _apply_filters_and_sort(self, items, lowered=None, settings=None):
+        """Apply current filter and sort settings to items.
+        
+        lowered optionally holds the items' lowercase names (see _lowercase_names)
+        so the text filter and name sort reuse them instead of lowercasing again.
+        settings, a (show_hidden, filter_text, sort_mode) tuple, overrides the
+        current settings.
+        """
+        if settings is None:
+            settings = (self.show_hidden, self.filter_text, self.sort_mode)
+        show_hidden, filter_text, sort_mode = settings
         result = list(items)
         
         # Filter hidden files
-        if not self.show_hidden:
-            result = [item for item in result if not item[3]]
+        if not show_hidden:
+            keep = [not item[3] for item in result]
+            result = list(compress(result, keep))
+            if lowered is not None:
+                lowered = list(compress(lowered, keep))
         
         # Filter by text
-        if self.filter_text:
-            filter_lower = self.filter_text.lower()
-            result = [item for item in result if filter_lower in item[0].lower()]
+        if filter_text:
+            filter_lower = filter_text.lower()
+            if lowered is None:
+                lowered = [item[0].lower() for item in result]
+            keep = [filter_lower in name for name in lowered]
+            result = list(compress(result, keep))
+            lowered = list(compress(lowered, keep))
         
         # Sort
-        if self.sort_mode == 'size':
-            result.sort(key=lambda x: x[1], reverse=True)
-        elif self.sort_mode == 'name':
-            result.sort(key=lambda x: x[0].lower())
-        elif self.sort_mode == 'date':
-            result.sort(key=lambda x: x[4], reverse=True)
+        if sort_mode == 'size':
+            result.sort(key=itemgetter(1), reverse=True)
+        elif sort_mode == 'name':
+            if lowered is None:
+                result.sort(key=lambda x: x[0].lower())
+            else:
+                # Sort positions by the precomputed lowercase names, then reorder
+                order = sorted(range(len(result)), key=lowered.__getitem__)
+                result = [result[i] for i in order]
+        elif sort_mode == 'date':
+            result.sort(key=itemgetter(4), reverse=True)
         
         return result
     
     def get_directory(self, dir_path):
-        """Get cached directory contents with filters applied."""
-        abs_path = os.path.abspath(dir_path)
+        """Get cached directory contents with filters applied.
+        
+        The filtered and sorted view is kept per directory and reused until the
+        listing or the view settings change, so redrawing the same directory
+        does not re-sort it. Callers must treat the returned list as read-only.
+        """
+        abs_path = abspath_cached(dir_path)
         raw_items = self.cache.get(abs_path)
         if raw_items is None:
             return None
-        return self._apply_filters_and_sort(raw_items)
+        
+        settings = (self.show_hidden, self.filter_text, self.sort_mode)
+        view = self._views.get(abs_path)
+        if view is not None and view[0] is raw_items and view[1] == settings:
+            return view[2]
+        
+        prepared = self._prepared.pop(abs_path, None)
+        if prepared is not None and prepared[0] == settings and prepared[1] == raw_items:
+            result = prepared[2]
+        else:
+            lowered = None
+            if self.filter_text or self.sort_mode == 'name':
+                lowered = self._lowercase_names(abs_path, raw_items)[0]
+            result = self._apply_filters_and_sort(raw_items, lowered)
+        self._views[abs_path] = (raw_items, settings, result)
+        return result
+    
+    def prepare_views(self, dir_paths):
+        """Build the filtered, sorted views of cached directories on a background thread.
+        
+        Each listing is copied here, on the calling thread, so the worker never
+        reads a listing that is being edited in place. get_directory only adopts
+        a prepared view while the listing still equals the copy it was built
+        from. Returns the thread, or None when none of the directories is cached.
+        """
+        settings = (self.show_hidden, self.filter_text, self.sort_mode)
+        jobs = []
+        for dir_path in dir_paths:
+            abs_path = abspath_cached(dir_path)
+            raw_items = self.cache.get(abs_path)
+            if raw_items is None:
+                continue
+            view = self._views.get(abs_path)
+            if view is None or view[0] is not raw_items or view[1] != settings:
+                jobs.append((abs_path, list(raw_items)))
+        if not jobs:
+            return None
+        
+        # A fresh dict per call: views from an older, slower worker land in its own dict
+        prepared = self._prepared = {}
+        
+        def _prepare():
+            for abs_path, items in jobs:
+                prepared[abs_path] = (settings, items, self._apply_filters_and_sort(items, settings=settings))
+        
+        thread = threading.Thread(target=_prepare, daemon=True)
+        thread.start()
+        return thread
+    
+    def is_dir(self, path):
+        """Answer whether path is a directory from the cached tree.
+        
+        Returns True or False for paths inside the scanned tree, or None when the
+        cache has no record of the path and the caller has to ask the filesystem.
+        """
+        abs_path = abspath_cached(path)
+        if abs_path in self.cache:
+            return True
+        if abs_path in self.sizes:
+            return False
+        return None
+    
+    def try_get(self, abs_path):
+        """Return the current listing of an absolute path, or None if it must be scanned.
+        
+        Does in one call what is_in_scope, validate and get_directory do for a
+        cache hit: a path outside the scan root or not cached is a miss, and a
+        cached one has its changed subdirectories rescanned, and the files of a
+        snapshot listing re-read, before the filtered listing is returned.
+        """
+        root = self.scan_root
+        if root is None or abs_path not in self.cache:
+            return None
+        if abs_path != root and not abs_path.startswith(root + os.sep):
+            return None
+        for dirty_dir in self.validate(abs_path):
+            self.rescan_subtree(dirty_dir)
+        self._restat_files(abs_path)
+        return self.get_directory(abs_path)
     
     def is_in_scope(self, dir_path):
         """Check if path is within the scan root."""
         if self.scan_root is None:
             return False
-        abs_path = os.path.abspath(dir_path)
+        abs_path = abspath_cached(dir_path)
         return abs_path == self.scan_root or abs_path.startswith(self.scan_root + os.sep)
     
+    def validate(self, root, max_depth=3):
+        """Find cached directories under root whose contents changed on disk.
+        
+        Only directory mtimes are compared, breadth-first down to max_depth levels,
+        so file inodes are never touched. A changed mtime only covers the
+        directory's own entries, so the search carries on below a changed
+        directory; one that can no longer be read is not descended into.
+        Directories without a recorded stamp are trusted as before.
+        
+        Returns a set of dirty directory paths.
+        """
+        dirty = set()
+        queue = deque([(abspath_cached(root), 0)])
+        
+        while queue:
+            dir_path, depth = queue.popleft()
+            stamp = self.dir_mtimes_ns.get(dir_path)
+            if stamp is None:
+                continue
+            try:
+                if os.stat(dir_path).st_mtime_ns != stamp:
+                    dirty.add(dir_path)
+            except OSError:
+                dirty.add(dir_path)
+                continue
+            if depth < max_depth:
+                prefix = os.path.join(dir_path, '')
+                for name, _, is_dir, _, _ in self.cache.get(dir_path, ()):
+                    if is_dir:
+                        queue.append((prefix + name, depth + 1))
+        
+        return dirty
+    
+    def rescan_subtree(self, dir_path):
+        """Re-read a changed directory and splice the result into the cached tree.
+        
+        A cached directory is read again on its own: child directories already
+        in the cache keep their cached sizes (validate checks their own stamps),
+        new ones are walked, vanished ones are dropped, and the size difference
+        is rolled up through the ancestors. A directory the cache has no listing
+        for is walked in full.
+        """
+        abs_path = abspath_cached(dir_path)
+        if not os.path.isdir(abs_path):
+            self.remove_item(abs_path)
+            return
+        if abs_path in self.cache:
+            self._rescan_listing(abs_path)
+            return
+        
+        old_size = self.sizes.get(abs_path, 0)
+        parent_dir = self.parent.get(abs_path) or os.path.dirname(abs_path)
+        row = self._row_index.get(abs_path)
+        self._drop_subtree(abs_path)
+        new_size = self._walk_subtree(abs_path)
+        
+        if abs_path != self.scan_root:
+            # The directory's own row survives in its parent's listing; keep pointing at it
+            if parent_dir in self.cache:
+                self.parent[abs_path] = parent_dir
+            if row is not None:
+                self._row_index[abs_path] = row
+            self._update_row(abs_path)
+            self._roll_up(parent_dir, new_size - old_size)
+    
+    def _rescan_listing(self, abs_path):
+        """Re-read one cached directory's entries, reusing its children's cached subtrees."""
+        old_size = self.sizes.get(abs_path, 0)
+        _, mtime_ns, entries, subdirs = _scan_dir(abs_path)
+        subdirs = set(subdirs)
+        prefix = os.path.join(abs_path, '')
+        
+        seen = set()
+        items = []
+        dir_size = 0
+        dir_mtime = 0
+        for name, item_path, is_dir, size, mtime, is_hidden_item in entries:
+            seen.add(name)
+            if item_path in subdirs:
+                if item_path not in self.cache:
+                    # New directory, or a file replaced by one
+                    self._drop_subtree(item_path)
+                    self._walk_subtree(item_path)
+            else:
+                if item_path in self.cache:
+                    # A directory replaced by a file or symlink
+                    self._drop_subtree(item_path)
+                if not is_dir:
+                    old_file_size = self.sizes.get(item_path)
+                    if old_file_size != size:
+                        if old_file_size is not None and self._unindex_file(old_file_size, item_path):
+                            self._stale_files += 1
+                        self._index_file(size, item_path)
+                        heapq.heappush(self._file_heap, (-size, item_path))
+                    self.sizes[item_path] = size
+                    self.mtimes[item_path] = mtime
+            size = self.sizes.get(item_path, 0)
+            mtime = self.mtimes.get(item_path, 0)
+            items.append((name, size, is_dir, is_hidden_item, mtime))
+            dir_size += size
+            dir_mtime = max(dir_mtime, mtime)
+        
+        for item in self.cache[abs_path]:
+            if item[0] not in seen:
+                self._drop_subtree(prefix + item[0])
+        
+        if mtime_ns is None:
+            self.dir_mtimes_ns.pop(abs_path, None)
+        else:
+            self.dir_mtimes_ns[abs_path] = mtime_ns
+        self.sizes[abs_path] = dir_size
+        self.mtimes[abs_path] = dir_mtime
+        items.sort(key=itemgetter(1), reverse=True)
+        self.cache[abs_path] = items
+        self._index_rows(abs_path, items)
+        self._forget_listing(abs_path)
+        self._unverified.discard(abs_path)
+        
+        if abs_path != self.scan_root:
+            self._update_row(abs_path)
+            # Ancestors show the newest modification time below them, so carry it up too
+            current = self.parent.get(abs_path)
+            while current is not None and self.mtimes.get(current, 0) < dir_mtime:
+                self.mtimes[current] = dir_mtime
+                self._update_row(current)
+                current = self.parent.get(current)
+            self._roll_up(self.parent.get(abs_path) or os.path.dirname(abs_path), dir_size - old_size)
+    
     def invalidate(self):
         """Clear the cache."""
         self.cache = {}
         self.sizes = {}
         self.mtimes = {}
+        self.dir_mtimes_ns = {}
+        self.parent = {}
+        self._row_index = {}
+        self._reset_file_index()
+        self._views = {}
+        self._prepared = {}
+        self._names = {}
+        self._ext_totals = {}
+        self._unverified = set()
         self.scan_root = None
     
     def remove_item(self, item_path):
-        """Remove a specific item from cache."""
-        abs_path = os.path.abspath(item_path)
-        item_size = self.sizes.get(abs_path, 0)
-        parent_dir = os.path.dirname(abs_path)
-        item_name = os.path.basename(abs_path)
+        """Remove a specific item from cache.
         
-        if abs_path in self.sizes:
-            del self.sizes[abs_path]
-        if abs_path in self.mtimes:
-            del self.mtimes[abs_path]
-        if abs_path in self.cache:
-            del self.cache[abs_path]
+        Only the item (and its subtree) is dropped; the parent listing is edited in
+        place and the removed size is rolled up through the ancestors, so no rescan
+        is needed afterwards.
+        """
+        self.remove_items([item_path])
+    
+    def remove_items(self, item_paths):
+        """Remove several items from cache at once.
         
-        if parent_dir in self.cache:
-            self.cache[parent_dir] = [
-                item for item in self.cache[parent_dir] 
-                if item[0] != item_name
-            ]
+        Works like remove_item, but each affected parent listing is rewritten,
+        rolled up and re-stamped once for the whole batch.
+        """
+        removed = {}  # {parent_dir: [size, {names}]}
+        for item_path in item_paths:
+            abs_path = abspath_cached(item_path)
+            # Directories know their parent from the scan; only files split the path
+            parent_dir = self.parent.get(abs_path) or os.path.dirname(abs_path)
+            
+            # Paths the cache never saw have no size entry, no listing of their own and
+            # no cached parent listing that could hold their row; nothing to update
+            if abs_path not in self.sizes and abs_path not in self.cache and parent_dir not in self.cache:
+                continue
+            
+            batch = removed.setdefault(parent_dir, [0, set()])
+            batch[0] += self.sizes.get(abs_path, 0)
+            batch[1].add(os.path.basename(abs_path))
+            self._drop_subtree(abs_path)
         
-        current = parent_dir
-        while current and self.is_in_scope(current):
+        for parent_dir, (removed_size, names) in removed.items():
+            listing = self.cache.get(parent_dir)
+            if listing is not None:
+                listing[:] = [item for item in listing if item[0] not in names]
+                self._index_rows(parent_dir, listing)
+                self._forget_listing(parent_dir)
+            
+            self._roll_up(parent_dir, -removed_size)
+            
+            # The removal itself changed the parent's mtime; re-stamp so the listing stays valid
+            if parent_dir in self.dir_mtimes_ns:
+                try:
+                    self.dir_mtimes_ns[parent_dir] = os.stat(parent_dir).st_mtime_ns
+                except OSError:
+                    del self.dir_mtimes_ns[parent_dir]
+    
+    def _drop_subtree(self, abs_path):
+        """Forget a path and, for directories, everything cached beneath it."""
+        stack = [abs_path]
+        while stack:
+            path = stack.pop()
+            size = self.sizes.pop(path, None)
+            self.mtimes.pop(path, None)
+            self.dir_mtimes_ns.pop(path, None)
+            self.parent.pop(path, None)
+            self._row_index.pop(path, None)
+            self._forget_listing(path)
+            listing = self.cache.pop(path, None)
+            if self._unindex_file(size, path):
+                self._stale_files += 1
+            if listing:
+                prefix = os.path.join(path, '')
+                stack.extend(prefix + item[0] for item in listing)
+    
+    def _roll_up(self, dir_path, delta):
+        """Apply a size change to dir_path and every cached ancestor row.
+        
+        Ancestors are followed through the parent pointers recorded at scan time,
+        which end at the scan root.
+        """
+        if not delta:
+            return
+        current = dir_path
+        while current is not None:
             if current in self.sizes:
-                self.sizes[current] -= item_size
-            current = os.path.dirname(current)
-            if current == os.path.dirname(current):
-                break
+                self.sizes[current] += delta
+                self._update_row(current)
+            current = self.parent.get(current)
+    
+    def _update_row(self, dir_path):
+        """Refresh a directory's size and mtime in its parent's listing."""
+        parent_dir = self.parent.get(dir_path)
+        listing = self.cache.get(parent_dir)
+        if listing is None:
+            return
+        self._views.pop(parent_dir, None)
+        name = os.path.basename(dir_path)
+        i = self._row_index.get(dir_path)
+        if i is None or i >= len(listing) or listing[i][0] != name:
+            i = next((j for j, item in enumerate(listing) if item[0] == name), None)
+            if i is None:
+                return
+            self._row_index[dir_path] = i
+        item_name, _, is_dir, is_hid, mtime = listing[i]
+        listing[i] = (item_name, self.sizes[dir_path], is_dir, is_hid,
+                      self.mtimes.get(dir_path, mtime))
     
     def set_filter(self, text):
         """Set filter text (None to clear)."""
@@ -182,30 +1053,57 @@ class DirectoryCache:
     
     def get_extension_stats(self, dir_path=None):
         """Get breakdown of sizes by file extension.
-        This is now fast - just iterates through cached sizes dict.
+        
+        Each cached listing keeps its own per-extension totals, built on first use,
+        so a query only merges one small dict per directory; a directory outside
+        the cache is read once with scandir, taking sizes from the directory
+        entries. Returns an ExtensionStats dict of the 15 largest extensions.
         """
         target = dir_path or self.scan_root
         if not target:
-            return {}
+            return ExtensionStats()
         
         ext_sizes = {}
-        for path, size in self.sizes.items():
-            if path.startswith(target) and path not in self.cache:  # Not a directory
-                ext = os.path.splitext(path)[1].lower() or 'no extension'
-                ext_sizes[ext] = ext_sizes.get(ext, 0) + size
+        if abspath_cached(target) in self.cache:
+            for listing_dir, listing in self._iter_listings(target):
+                for ext, size in self._extension_totals(listing_dir, listing).items():
+                    ext_sizes[ext] = ext_sizes.get(ext, 0) + size
+        else:
+            for _, _, entries in _parallel_walk(target, self.scan_workers):
+                for name, _, is_dir, size, _, _ in entries:
+                    if not is_dir:
+                        ext = _extension(name)
+                        ext_sizes[ext] = ext_sizes.get(ext, 0) + size
         
         # Sort by size
-        return dict(sorted(ext_sizes.items(), key=lambda x: x[1], reverse=True)[:15])
+        return ExtensionStats(heapq.nlargest(15, ext_sizes.items(), key=itemgetter(1)))
+    
+    def _extension_totals(self, dir_path, raw_items):
+        """Return {extension: total_size} for a listing's files, built once per listing."""
+        entry = self._ext_totals.get(dir_path)
+        if entry is not None and entry[0] is raw_items:
+            return entry[1]
+        totals = {}
+        for name, size, is_dir, _, _ in raw_items:
+            if not is_dir:
+                ext = _extension(name)
+                totals[ext] = totals.get(ext, 0) + size
+        self._ext_totals[dir_path] = (raw_items, totals)
+        return totals
     
-    def get_age_color(self, mtime):
-        """Get age category based on modification time."""
+    def get_age_color(self, mtime, now=None):
+        """Get age category based on modification time.
+        
+        When coloring many rows, pass now (a time.time() value) taken once so
+        each row costs a subtraction and two float comparisons.
+        """
         if mtime == 0:
             return 'unknown'
         
-        age = datetime.now() - datetime.fromtimestamp(mtime)
-        if age > timedelta(days=365):
+        age = (time.time() if now is None else now) - mtime
+        if age > OLD_AGE:
             return 'old'      # > 1 year
-        elif age > timedelta(days=90):
+        elif age > MEDIUM_AGE:
             return 'medium'   # 3-12 months
         else:
             return 'recent'   # < 3 months
@@ -227,46 +1125,47 @@ class DirectoryCache:
         
         # Group by size (skip tiny files)
         size_groups = {}
-        for path, size in self.sizes.items():
-            if path.startswith(target) and size >= min_size:
-                # Only consider files, not directories
-                if path not in self.cache:  # Not a directory
-                    if size not in size_groups:
-                        size_groups[size] = []
-                    size_groups[size].append(path)
+        if self._indexed and abspath_cached(target) == self.scan_root:
+            for size, paths in self._by_size.items():
+                # Single-file sizes are stored as a bare path and cannot have duplicates
+                if size >= min_size and not isinstance(paths, str):
+                    size_groups[size] = list(paths)
+        else:
+            # Below the root, only the listings of the subtree itself are visited
+            for size, path, _ in self._iter_subtree_files(target):
+                if size >= min_size:
+                    size_groups.setdefault(size, []).append(path)
         
         # Only keep groups with potential duplicates
-        potential_dups = {k: v for k, v in size_groups.items() if len(v) > 1}
+        groups = [(size, paths) for size, paths in size_groups.items() if len(paths) > 1]
         
-        duplicates = []
-        total_groups = len(potential_dups)
-        processed = 0
-        
-        for size, paths in potential_dups.items():
-            processed += 1
-            update_spinner_folder(f"Checking {processed}/{total_groups} groups")
+        # Hashing waits on the disk, so every stage runs across all groups on one pool
+        with ThreadPoolExecutor(max_workers=self.scan_workers) as pool:
+            # A 4 KB probe separates most unrelated files before reading more of them
+            update_spinner_folder(f"Probing {sum(len(paths) for _, paths in groups)} files")
+            groups = _split_groups(groups, lambda path, size: _probe(path), pool)
             
-            # Hash first 64KB of each file for quick comparison
-            hashes = {}
-            for path in paths:
-                try:
-                    with open(path, 'rb') as f:
-                        file_hash = hashlib.md5(f.read(65536)).hexdigest()
-                    if file_hash not in hashes:
-                        hashes[file_hash] = []
-                    hashes[file_hash].append(path)
-                except (OSError, PermissionError):
-                    pass
+            # Then head + tail, which covers files up to 2 * FINGERPRINT_BYTES entirely
+            small = [group for group in groups if group[0] <= PROBE_BYTES]
+            large = [group for group in groups if group[0] > PROBE_BYTES]
+            update_spinner_folder(f"Fingerprinting {sum(len(paths) for _, paths in large)} files")
+            groups = small + _split_groups(large, _fingerprint, pool)
             
-            for file_hash, hash_paths in hashes.items():
-                if len(hash_paths) > 1:
-                    wasted = size * (len(hash_paths) - 1)
-                    duplicates.append({
-                        'size': size,
-                        'files': hash_paths,
-                        'wasted': wasted,
-                        'count': len(hash_paths)
-                    })
+            # Fingerprints only cover large files partially; confirm those with a full hash
+            small = [group for group in groups if group[0] <= 2 * FINGERPRINT_BYTES]
+            large = [group for group in groups if group[0] > 2 * FINGERPRINT_BYTES]
+            update_spinner_folder(f"Hashing {sum(len(paths) for _, paths in large)} files")
+            groups = small + _split_groups(large, lambda path, size: _full_hash(path), pool)
+        
+        duplicates = []
+        for size, hash_paths in groups:
+            wasted = size * (len(hash_paths) - 1)
+            duplicates.append({
+                'size': size,
+                'files': hash_paths,
+                'wasted': wasted,
+                'count': len(hash_paths)
+            })
         
         # Sort by wasted space (largest first)
         duplicates.sort(key=lambda x: x['wasted'], reverse=True)
@@ -288,25 +1187,45 @@ class DirectoryCache:
         search_lower = search_text.lower()
         results = []
         
-        # Search through all cached paths
-        for path, size in self.sizes.items():
-            if not path.startswith(target):
+        # Walk the cached listings under target. Each directory's names are also kept
+        # joined in one lowercase string, so a directory without a match is rejected
+        # by a single substring test instead of a per-name loop.
+        for dir_path, listing in self._iter_listings(target):
+            lowered, blob = self._lowercase_names(dir_path, listing)
+            if search_lower not in blob:
                 continue
-            
-            name = os.path.basename(path)
-            if search_lower in name.lower():
-                is_dir = os.path.isdir(path)
-                mtime = self.mtimes.get(path, 0)
-                is_hid = is_hidden(path)
-                # Get relative path from target
-                rel_path = os.path.dirname(path).replace(target, '.', 1)
-                results.append((path, name, size, is_dir, is_hid, mtime, rel_path))
-        
-        # Sort by size (largest first)
-        results.sort(key=lambda x: x[2], reverse=True)
+            # Get relative path from target
+            rel_path = dir_path.replace(target, '.', 1)
+            for (name, size, is_dir, is_hid, mtime), name_lower in zip(listing, lowered):
+                if search_lower in name_lower:
+                    path = os.path.join(dir_path, name)
+                    results.append((path, name, size, is_dir, is_hid, mtime, rel_path))
         
         stop_spinner()
-        return results[:100]  # Limit to 100 results
+        # Largest first, limited to 100 results
+        return heapq.nlargest(100, results, key=itemgetter(2))
+    
+    def _iter_subtree_files(self, root):
+        """Yield (size, path, is_hidden) for every cached file under root, from its listings."""
+        for dir_path, listing in self._iter_listings(root):
+            prefix = os.path.join(dir_path, '')
+            for name, size, is_dir, is_hid, _ in listing:
+                if not is_dir:
+                    yield size, prefix + name, is_hid
+    
+    def _iter_listings(self, root):
+        """Yield (dir_path, raw_items) for every cached directory under root, top-down."""
+        stack = [abspath_cached(root)]
+        while stack:
+            dir_path = stack.pop()
+            listing = self.cache.get(dir_path)
+            if listing is None:
+                continue
+            yield dir_path, listing
+            prefix = os.path.join(dir_path, '')
+            for row in listing:
+                if row[2] and prefix + row[0] in self.cache:
+                    stack.append(prefix + row[0])
     
     def get_largest_files(self, dir_path=None, limit=50, show_progress=True):
         """Get the largest files in the cached tree, sorted by size.
@@ -325,22 +1244,25 @@ class DirectoryCache:
         if show_progress:
             start_spinner("Finding largest files...")
         
-        results = []
+        if self._indexed and abspath_cached(target) == self.scan_root:
+            # Every indexed file is under the root: walk the size heap largest-first
+            # (the heap holds no hidden flags; those few are looked up per result)
+            largest = ((size, path, None) for size, path in self._iter_largest_files())
+        else:
+            # Visit only the listings under target and keep the top `limit` files,
+            # instead of testing every cached path against the target prefix
+            largest = heapq.nlargest(limit, self._iter_subtree_files(target), key=itemgetter(0))
         
-        # Get all files from cache (use cache dict to avoid os.path.isdir calls)
-        for path, size in self.sizes.items():
-            if not path.startswith(target):
-                continue
-            # Only include files, not directories (directories are keys in self.cache)
-            if path not in self.cache:
-                name = os.path.basename(path)
-                mtime = self.mtimes.get(path, 0)
+        results = []
+        for size, path, is_hid in largest:
+            name = os.path.basename(path)
+            mtime = self.mtimes.get(path, 0)
+            if is_hid is None:
                 is_hid = is_hidden(path)
-                rel_path = os.path.dirname(path).replace(target, '.', 1)
-                results.append((path, name, size, is_hid, mtime, rel_path))
-        
-        # Sort by size (largest first)
-        results.sort(key=lambda x: x[2], reverse=True)
+            rel_path = os.path.dirname(path).replace(target, '.', 1)
+            results.append((path, name, size, is_hid, mtime, rel_path))
+            if len(results) >= limit:
+                break
         
         if show_progress:
             stop_spinner()
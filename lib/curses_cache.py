@@ -5,21 +5,27 @@ import threading
 import subprocess
 import queue
 import time
-from .cache import DirectoryCache
+from .cache import DirectoryCache, scandir_stream, STREAM_CHUNK, _parallel_walk, _entry_hidden
 
 HAS_DU = shutil.which('du') is not None
+# Threads per fallback size walk; each of the cache's workers may run one at a time,
+# so this stays low enough not to thrash a spinning disk
+DIR_SIZE_WORKERS = 8
+# Seconds a calculated directory size is trusted; an older size is still shown,
+# but recalculated in the background the next time its row is listed
+SIZE_TTL = 300.0
 
 def calculate_dir_size_python(path):
+    """Total the file sizes under path with a parallel scandir walk.
+    
+    Sizes come from the directory entries' lstat, so symlinks are not followed,
+    the same as du.
+    """
     total = 0
-    try:
-        for root, dirs, files in os.walk(path):
-            for f in files:
-                try:
-                    total += os.path.getsize(os.path.join(root, f))
-                except OSError:
-                    pass
-    except OSError:
-        pass
+    for _, _, entries in _parallel_walk(path, DIR_SIZE_WORKERS):
+        for _, _, is_dir, size, _, _ in entries:
+            if not is_dir:
+                total += size
     return total
 
 
@@ -50,6 +56,8 @@ class CursesDirectoryCache(DirectoryCache):
         self.calculating_dirs_lock = threading.RLock()
         self.calculating_dirs = set()
         self.scan_start_time = None
+        self.size_times = {}  # {directory_path: time.monotonic() when its size was calculated}
+        self._stream = None  # state of the most recent directory listing stream
         
         # Start worker threads
         self.workers = []
@@ -84,6 +92,11 @@ class CursesDirectoryCache(DirectoryCache):
         for _ in self.workers:
             self.queue.put(None)
 
+    def store_dir_size(self, path, size):
+        """Record a calculated directory size and when it was calculated."""
+        self.sizes[path] = size
+        self.size_times[path] = time.monotonic()
+
     def set_update_flag(self):
         with self.cache_updated_lock:
             self.cache_updated = True
@@ -96,54 +109,128 @@ class CursesDirectoryCache(DirectoryCache):
             return False
 
     def scan_directory_tree(self, root_path):
-        self.scan_root = os.path.realpath(root_path)
-        self.scanned_directories.add(self.scan_root)
+        """List root_path, returning as soon as the first batch of entries is read.
+        
+        Large directories are streamed: the first STREAM_CHUNK entries are
+        returned right away and the rest are read on a background thread, which
+        raises the update flag as batches land. Calls made while a stream for
+        the same directory is running return what has been read so far.
+        Moving to another directory cancels the running stream.
+        """
+        root = os.path.realpath(root_path)
+        stream = self._stream
+        if stream is not None and stream['root'] == root:
+            if not stream['done'] or stream['fresh']:
+                # Still streaming, or this is the refresh its completion asked for
+                stream['fresh'] = False
+                return self._apply_filters_and_sort(self.cache.get(root, []))
+        if stream is not None:
+            stream['cancel'].set()
+        
+        self.scan_root = root
+        self.scanned_directories.add(root)
+        
+        # Show batches as they arrive only on a first visit; a rescan keeps
+        # showing the previous complete listing until the new one is done
+        stream = {
+            'root': root,
+            'cancel': threading.Event(),
+            'done': False,
+            'fresh': False,
+            'progressive': root not in self.cache,
+        }
+        self._stream = stream
         
         items = []
-        needs_size_calc = []
+        try:
+            chunks = scandir_stream(root, cancel=stream['cancel'])
+            first = next(chunks, [])
+        except (OSError, PermissionError):
+            chunks, first = iter(()), []
         
+        self._add_entries(first, items)
+        if len(first) < STREAM_CHUNK:
+            stream['done'] = True
+            self._publish(stream, items)
+        else:
+            self._publish(stream, items, force=stream['progressive'])
+            threading.Thread(target=self._finish_stream, args=(stream, chunks, items), daemon=True).start()
+        
+        return self._apply_filters_and_sort(self.cache.get(root, []))
+    
+    def _finish_stream(self, stream, chunks, items):
+        """Read the remaining batches of a streamed directory in the background."""
         try:
-            for entry in os.scandir(self.scan_root):
-                try:
-                    name = entry.name
-                    path = os.path.realpath(entry.path)
-                    is_dir = entry.is_dir(follow_symlinks=False)
-                    is_hid = name.startswith('.')
-                    stat = entry.stat(follow_symlinks=False)
-                    mtime = stat.st_mtime
-                    
-                    if is_dir:
-                        if path in self.sizes and self.sizes[path] >= 0:
-                            size = self.sizes[path]
-                        else:
-                            size = -1
-                            # Deduplicate background tasks: only scan if not already in progress
-                            with self.calculating_dirs_lock:
-                                if path not in self.calculating_dirs:
-                                    self.calculating_dirs.add(path)
-                                    if self.scan_start_time is None:
-                                        self.scan_start_time = time.time()
-                                    needs_size_calc.append(path)
-                    else:
-                        size = stat.st_size
-                        self.sizes[path] = size
-                    
-                    self.mtimes[path] = mtime
-                    items.append((name, size, is_dir, is_hid, mtime))
-                except (OSError, PermissionError):
-                    pass
+            for batch in chunks:
+                self._add_entries(batch, items)
+                if stream['progressive']:
+                    self._publish(stream, items)
+                    self.set_update_flag()
         except (OSError, PermissionError):
             pass
-            
-        self.cache[self.scan_root] = self._apply_filters_and_sort(items)
-        self.sizes[self.scan_root] = sum(item[1] for item in items if item[1] >= 0)
+        if stream['cancel'].is_set():
+            return
+        stream['done'] = True
+        stream['fresh'] = True
+        self._publish(stream, items)
+        self.set_update_flag()
+    
+    def _publish(self, stream, items, force=True):
+        """Store the entries read so far as the listing for the stream's directory."""
+        if not force or stream['cancel'].is_set():
+            return
+        root = stream['root']
+        with self.cache_updated_lock:
+            # Pick up directory sizes that finished while the listing was being read
+            current = []
+            for name, size, is_dir, is_hid, mtime in items:
+                if is_dir and size < 0:
+                    size = self.sizes.get(os.path.join(root, name), -1)
+                current.append((name, size, is_dir, is_hid, mtime))
+            self.cache[root] = self._apply_filters_and_sort(current)
+            self.sizes[root] = sum(item[1] for item in current if item[1] >= 0)
+    
+    def _add_entries(self, entries, items):
+        """Stat a batch of entries into items and queue size calculations for new subdirectories."""
+        needs_size_calc = []
+        now = time.monotonic()
+        for entry in entries:
+            try:
+                name = entry.name
+                path = os.path.realpath(entry.path)
+                is_dir = entry.is_dir(follow_symlinks=False)
+                # Reads the Windows hidden attribute from the entry's cached stat
+                is_hid = _entry_hidden(entry)
+                stat = entry.stat(follow_symlinks=False)
+                mtime = stat.st_mtime
+                
+                if is_dir:
+                    size = self.sizes.get(path, -1)
+                    stamp = self.size_times.get(path)
+                    if size < 0 or stamp is None or now - stamp > SIZE_TTL:
+                        # Unknown or expired; an expired size stays on screen until the new one lands
+                        # Deduplicate background tasks: only scan if not already in progress
+                        with self.calculating_dirs_lock:
+                            if path not in self.calculating_dirs:
+                                self.calculating_dirs.add(path)
+                                if self.scan_start_time is None:
+                                    self.scan_start_time = time.time()
+                                needs_size_calc.append(path)
+                else:
+                    size = stat.st_size
+                    self.sizes[path] = size
+                
+                self.mtimes[path] = mtime
+                items.append((name, size, is_dir, is_hid, mtime))
+            except (OSError, PermissionError):
+                pass
  
         # Submit individual size calculations one-by-one to ThreadPoolExecutor
         for path in needs_size_calc:
             def make_task(p):
                 def task():
                     sz = get_single_dir_size(p)
-                    self.sizes[p] = sz
+                    self.store_dir_size(p, sz)
                     
                     # Remove from active calculation tracking
                     with self.calculating_dirs_lock:
@@ -174,7 +261,5 @@ class CursesDirectoryCache(DirectoryCache):
             
             self.submit(make_task(path))
 
-        return self._apply_filters_and_sort(self.cache[self.scan_root])
-
 
 du_cache = CursesDirectoryCache()
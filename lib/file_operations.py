@@ -3,10 +3,15 @@
 File operations for DiskMan V3.
 """
 import os
+import re
+import csv
 import shutil
+import stat
 import datetime
 import sys
-from .utils import get_size, is_hidden, start_spinner, stop_spinner
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from .utils import get_size, is_hidden, start_spinner, stop_spinner, isdir_cached, forget_isdir, abspath_cached, fast_naturalsize
 from .cache import get_cache
 from colorama import Fore, Style
 
@@ -17,21 +22,84 @@ try:
 except ImportError:
     TRASH_AVAILABLE = False
 
+# In-kernel file copies (Linux, Python 3.8+); data never passes through user space
+HAS_COPY_FILE_RANGE = hasattr(os, 'copy_file_range')
+# sendfile into a regular file is Linux-only; elsewhere it needs a socket
+HAS_SENDFILE = hasattr(os, 'sendfile') and sys.platform.startswith('linux')
+HAS_KERNEL_COPY = HAS_COPY_FILE_RANGE or HAS_SENDFILE
+COPY_RANGE_CHUNK = 1 << 30
+# Smaller in-kernel steps when a progress callback wants regular updates
+COPY_PROGRESS_CHUNK = 64 << 20
+# Buffer for copies the kernel would not do; filled with readinto and reused
+COPY_BUFFER_SIZE = 4 << 20
+
+# Permanent deletes are issued relative to an open parent directory fd (unlinkat)
+_UNLINK_DIR_FD = os.unlink in os.supports_dir_fd and os.stat in os.supports_dir_fd
+_RMTREE_DIR_FD = sys.version_info >= (3, 11)
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)
+
+# Reports are written through a 1 MB buffer rather than the default 8 KB
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# File preview: only this much of a text file is ever read
+PREVIEW_BYTES = 64 * 1024
+TEXT_EXTENSIONS = frozenset({'.txt', '.md', '.py', '.js', '.json', '.html', '.css',
+                             '.xml', '.yml', '.yaml', '.sh', '.bat', '.log', '.csv',
+                             '.ini', '.cfg', '.conf', '.toml'})
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.webm', '.m4v'})
+AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.flac', '.aac', '.m4a', '.ogg'})
+# Preview kind by extension, so a preview needs one lookup; anything else is 'binary'
+_PREVIEW_KINDS = {
+    **dict.fromkeys(TEXT_EXTENSIONS, 'text'),
+    **dict.fromkeys(IMAGE_EXTENSIONS, 'image'),
+    **dict.fromkeys(VIDEO_EXTENSIONS, 'video'),
+    **dict.fromkeys(AUDIO_EXTENSIONS, 'audio'),
+}
+
+# Shared pool for batched removals; the work is I/O bound and releases the GIL
+_io_executor = ThreadPoolExecutor(max_workers=16)
+
+# Recently computed item details, most recent last:
+# {path: ((st_mtime_ns, st_size) when read, details)}
+DETAILS_CACHE_SIZE = 4096
+_details_memo = OrderedDict()
+
 
 def list_directory_cached(directory, force_rescan=False):
-    """List directory contents using cache when possible."""
+    """List directory contents using cache when possible.
+    
+    Cached listings are validated by directory mtime first; only directories
+    that changed on disk are rescanned. The same applies to a directory's
+    snapshot saved by an earlier run.
+    """
     cache = get_cache()
-    abs_dir = os.path.abspath(directory)
+    abs_dir = abspath_cached(directory)
     
-    if not force_rescan and cache.is_in_scope(abs_dir):
-        cached_items = cache.get_directory(abs_dir)
+    if force_rescan:
+        forget_isdir(abs_dir)
+    else:
+        cached_items = cache.try_get(abs_dir)
         if cached_items is not None:
             return cached_items, True
     
-    items = cache.scan_directory_tree(abs_dir)
+    # A saved scan from an earlier run is only reused when no rescan was asked for
+    items = cache.scan_directory_tree(abs_dir, reuse_snapshot=not force_rescan, save_snapshot=True)
     return items, False
 
 
+def prefetch_listings(directories):
+    """Prepare the filtered, sorted views of cached directories in the background.
+    
+    Call this before blocking on input with the directories the user is likely
+    to open next; list_directory_cached then finds their views ready. Only
+    directories already in the cache are touched, so nothing is read from disk.
+    The worker sorts copies of the listings taken here (see
+    DirectoryCache.prepare_views), never the live ones.
+    """
+    return get_cache().prepare_views(d for d in directories if d)
+
+
 def delete_item(item_path, use_trash=True):
     """Delete a file or directory.
     
@@ -65,22 +133,177 @@ def delete_item(item_path, use_trash=True):
         return False, str(e)
 
 
+def _remove_path(item_path):
+    if os.path.isdir(item_path) and not os.path.islink(item_path):
+        shutil.rmtree(item_path)
+    else:
+        os.remove(item_path)
+
+
+def _remove_at(dir_fd, name, item_path):
+    st = os.stat(name, dir_fd=dir_fd, follow_symlinks=False)
+    if stat.S_ISDIR(st.st_mode):
+        if _RMTREE_DIR_FD:
+            shutil.rmtree(name, dir_fd=dir_fd)
+        else:
+            shutil.rmtree(item_path)
+    else:
+        os.unlink(name, dir_fd=dir_fd)
+
+
+def unlink_many(item_paths):
+    """Permanently delete several paths, batching them by parent directory.
+    
+    Each parent directory is opened once and its entries are removed relative
+    to that fd, instead of resolving every full path again. Entries of one
+    parent are removed in parallel. Symlinks are removed, never followed.
+    
+    Returns:
+        list of (path, error) in input order; error is None on success
+    """
+    by_parent = {}
+    for item_path in item_paths:
+        parent, name = os.path.split(abspath_cached(item_path))
+        by_parent.setdefault(parent, []).append((item_path, name))
+    
+    errors = {}
+    for parent, entries in by_parent.items():
+        fd = None
+        if _UNLINK_DIR_FD:
+            try:
+                fd = os.open(parent, _DIR_OPEN_FLAGS)
+            except OSError:
+                fd = None
+        
+        def remove(entry, fd=fd):
+            item_path, name = entry
+            try:
+                if fd is None:
+                    _remove_path(item_path)
+                else:
+                    _remove_at(fd, name, item_path)
+                return None
+            except OSError as e:
+                return str(e)
+        
+        try:
+            if len(entries) == 1:
+                outcomes = [remove(entries[0])]
+            else:
+                # Removals under one parent are independent; the fd is only
+                # read, so the workers can share it
+                outcomes = _io_executor.map(remove, entries)
+            for (item_path, _), error in zip(entries, outcomes):
+                errors[item_path] = error
+        finally:
+            if fd is not None:
+                os.close(fd)
+    
+    return [(item_path, errors[item_path]) for item_path in item_paths]
+
+
+def _trash_many(item_paths):
+    """Move several paths to the Trash in one send2trash call.
+    
+    If the batch fails part way, the paths that are gone since count as
+    trashed and the rest are retried one at a time so each gets its own error.
+    
+    Returns:
+        list of (success: bool, message: str) in input order
+    """
+    results = {}
+    present = []
+    for item_path in item_paths:
+        if os.path.lexists(item_path):
+            present.append(item_path)
+        else:
+            results[item_path] = (False, f"No such file or directory: '{item_path}'")
+    
+    try:
+        if present:
+            send2trash(present)
+        batch_failed = False
+    except Exception:
+        batch_failed = True
+    
+    for item_path in present:
+        if not batch_failed or not os.path.lexists(item_path):
+            results[item_path] = (True, "Moved to Trash")
+            continue
+        try:
+            send2trash(item_path)
+            results[item_path] = (True, "Moved to Trash")
+        except Exception as e:
+            results[item_path] = (False, str(e))
+    return [results[item_path] for item_path in item_paths]
+
+
+def delete_items(item_paths, use_trash=True):
+    """Delete several files or directories.
+    
+    Trash moves are handed to send2trash as one batch; permanent deletes are
+    batched through unlink_many.
+    
+    Returns:
+        list of (success: bool, message: str) in input order
+    """
+    if not item_paths:
+        return []
+    
+    if use_trash and TRASH_AVAILABLE:
+        start_spinner(f"Moving {len(item_paths)} item(s) to Trash...")
+        results = _trash_many(item_paths)
+        stop_spinner()
+        return results
+    
+    start_spinner(f"Permanently deleting {len(item_paths)} item(s)...")
+    results = [(error is None, error or "Permanently deleted")
+               for _, error in unlink_many(item_paths)]
+    stop_spinner()
+    return results
+
+
+def _stat_or_none(path):
+    """os.stat(path), or None when it does not exist or cannot be read."""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _resolve_destination(name, dest_path):
+    """Return the target path for an item called name: inside dest_path if it is a directory."""
+    dest_st = _stat_or_none(dest_path)
+    if dest_st is not None and stat.S_ISDIR(dest_st.st_mode):
+        return os.path.join(dest_path, name)
+    return dest_path
+
+
 def copy_item(source_path, dest_path, progress_callback=None):
     """Copy a file or directory to destination."""
     try:
         name = os.path.basename(source_path)
+        dest_path = _resolve_destination(name, dest_path)
         
-        if os.path.isdir(dest_path):
-            dest_path = os.path.join(dest_path, name)
-        
-        if os.path.isdir(source_path):
+        # One stat answers both "is it a directory" and the file size for the copy
+        source_st = os.stat(source_path)
+        if stat.S_ISDIR(source_st.st_mode):
             start_spinner(f"Copying directory: {name}...")
-            shutil.copytree(source_path, dest_path)
+            # An existing target raises FileExistsError rather than being merged into.
+            # Without an in-kernel copy, copytree's default copy2 is the faster choice
+            shutil.copytree(source_path, dest_path,
+                            copy_function=_fastcopy if HAS_KERNEL_COPY else shutil.copy2)
         else:
             start_spinner(f"Copying file: {name}...")
-            _copy_with_progress(source_path, dest_path)
+            if HAS_KERNEL_COPY or progress_callback:
+                _copy_with_progress(source_path, dest_path, progress_callback, source_st.st_size)
+            else:
+                # No in-kernel copy here; copy2 uses the platform's native file copy
+                shutil.copy2(source_path, dest_path)
         
         stop_spinner()
+        _forget_details(dest_path)
+        forget_isdir(dest_path)
         return True, dest_path
     except Exception as e:
         stop_spinner()
@@ -91,43 +314,161 @@ def move_item(source_path, dest_path):
     """Move a file or directory to destination."""
     try:
         name = os.path.basename(source_path)
-        
-        if os.path.isdir(dest_path):
-            dest_path = os.path.join(dest_path, name)
+        dest_path = _resolve_destination(name, dest_path)
         
         start_spinner(f"Moving: {name}...")
         shutil.move(source_path, dest_path)
         stop_spinner()
+        for path in (source_path, dest_path):
+            _forget_details(path)
+            forget_isdir(path)
         return True, dest_path
     except Exception as e:
         stop_spinner()
         return False, str(e)
 
 
-def _copy_with_progress(source_path, dest_path):
-    """Copy file with progress display."""
-    file_size = os.path.getsize(source_path)
+def _copy_in_kernel(in_fd, out_fd, report=None):
+    """Copy with os.copy_file_range until EOF or until the kernel refuses.
+    
+    Returns the number of bytes copied so a caller can finish the rest itself.
+    """
+    chunk = COPY_PROGRESS_CHUNK if report else COPY_RANGE_CHUNK
+    copied = 0
+    try:
+        while True:
+            sent = os.copy_file_range(in_fd, out_fd, chunk)
+            if sent == 0:
+                break
+            copied += sent
+            if report:
+                report(copied)
+    except OSError:
+        # EXDEV/ENOSYS/EINVAL etc. on older kernels or unsupported filesystems
+        pass
+    return copied
+
+
+def _send_in_kernel(in_fd, out_fd, offset, report=None):
+    """Copy with os.sendfile from offset until EOF or until the kernel refuses.
+    
+    Writes at out_fd's current position; returns the offset reached.
+    """
+    chunk = COPY_PROGRESS_CHUNK if report else COPY_RANGE_CHUNK
+    try:
+        while True:
+            sent = os.sendfile(out_fd, in_fd, offset, chunk)
+            if sent == 0:
+                break
+            offset += sent
+            if report:
+                report(offset)
+    except OSError:
+        pass
+    return offset
+
+
+def _copy_with_progress(source_path, dest_path, progress_callback=None, file_size=None):
+    """Copy file, calling progress_callback(copied, total) as data is written.
+    
+    Tries copy_file_range first (which reflinks or copies server-side where the
+    filesystem supports it), then sendfile, and finishes whatever is left with
+    a buffered read/write loop. That loop always runs to EOF: st_size is 0 for
+    files that still have content (procfs, sysfs, some FUSE mounts), so it is
+    only used for progress. Pass file_size when the caller already has it.
+    """
+    if file_size is None:
+        file_size = os.path.getsize(source_path)
+    report = None
+    if progress_callback:
+        report = lambda copied: progress_callback(copied, file_size)
     
     with open(source_path, 'rb') as fsrc:
         with open(dest_path, 'wb') as fdst:
             copied = 0
-            chunk_size = 1024 * 1024  # 1MB
+            if HAS_COPY_FILE_RANGE:
+                copied = _copy_in_kernel(fsrc.fileno(), fdst.fileno(), report)
+            if HAS_SENDFILE and copied < file_size:
+                copied = _send_in_kernel(fsrc.fileno(), fdst.fileno(), copied, report)
+            fsrc.seek(copied)
+            fdst.seek(copied)
+            buf = bytearray(COPY_BUFFER_SIZE)
+            view = memoryview(buf)
             while True:
-                chunk = fsrc.read(chunk_size)
-                if not chunk:
+                n = fsrc.readinto(buf)
+                if not n:
                     break
-                fdst.write(chunk)
-                copied += len(chunk)
+                fdst.write(view[:n])
+                copied += n
+                if report:
+                    report(copied)
+
+
+def _fastcopy(source_path, dest_path):
+    """copy_function for shutil.copytree: copy2's result, with the data copied in-kernel.
+    
+    Anything but a regular file, and a copy onto the source itself, goes to
+    shutil.copy2 so its SpecialFileError and SameFileError checks still apply.
+    """
+    source_st = os.stat(source_path)
+    if not stat.S_ISREG(source_st.st_mode):
+        return shutil.copy2(source_path, dest_path)
+    dest_st = _stat_or_none(dest_path)
+    if dest_st is not None and os.path.samestat(source_st, dest_st):
+        return shutil.copy2(source_path, dest_path)
+    _copy_with_progress(source_path, dest_path, file_size=source_st.st_size)
+    shutil.copystat(source_path, dest_path)
+    return dest_path
 
 
 def get_item_details(item_path):
-    """Get detailed information about a file or directory."""
+    """Get detailed information about a file or directory.
+    
+    Results are remembered (up to DETAILS_CACHE_SIZE paths) with the path's
+    mtime and size; each call checks them with one os.stat and reads the
+    details again when either changed.
+    """
     try:
-        name = os.path.basename(item_path)
-        size = get_size(item_path)
-        is_dir = os.path.isdir(item_path)
-        
         stats = os.stat(item_path)
+    except (OSError, PermissionError) as e:
+        _details_memo.pop(item_path, None)
+        print(f"{Fore.RED}Error getting item details: {e}{Style.RESET_ALL}")
+        return None
+    
+    stamp = (stats.st_mtime_ns, stats.st_size)
+    entry = _details_memo.get(item_path)
+    if entry is not None and entry[0] == stamp:
+        _details_memo.move_to_end(item_path)
+        return entry[1]
+    details = _read_item_details(item_path, stats)
+    if details is not None:
+        _details_memo[item_path] = (stamp, details)
+        _details_memo.move_to_end(item_path)
+        if len(_details_memo) > DETAILS_CACHE_SIZE:
+            _details_memo.popitem(last=False)
+    return details
+
+
+def _forget_details(item_path):
+    """Drop remembered details for item_path and its parents.
+    
+    A directory's mtime does not change when something deeper in it does, so
+    the parents' recursive sizes have to be dropped explicitly. Paths below
+    item_path need nothing: their own stamps no longer match.
+    """
+    path = item_path
+    while True:
+        _details_memo.pop(path, None)
+        parent = os.path.dirname(path)
+        if not parent or parent == path:
+            break
+        path = parent
+
+
+def _read_item_details(item_path, stats):
+    try:
+        name = os.path.basename(item_path)
+        is_dir = stat.S_ISDIR(stats.st_mode)
         created_time = datetime.datetime.fromtimestamp(stats.st_ctime)
         modified_time = datetime.datetime.fromtimestamp(stats.st_mtime)
         accessed_time = datetime.datetime.fromtimestamp(stats.st_atime)
@@ -135,7 +476,7 @@ def get_item_details(item_path):
         details = {
             'name': name,
             'path': item_path,
-            'size': size,
+            'size': 0 if is_dir else stats.st_size,
             'is_dir': is_dir,
             'created': created_time,
             'modified': modified_time,
@@ -144,24 +485,26 @@ def get_item_details(item_path):
         
         if is_dir:
             try:
+                # One scandir pass sizes each child, fills the preview and counts the
+                # entries; the directory's size is the sum of its children's
                 contents = []
-                for i, item in enumerate(os.listdir(item_path)):
-                    if i >= 20:
-                        contents.append("... (more items not shown)")
-                        break
-                    
-                    sub_path = os.path.join(item_path, item)
-                    sub_is_dir = os.path.isdir(sub_path)
-                    sub_size = get_size(sub_path)
-                    
-                    contents.append({
-                        'name': item,
-                        'is_dir': sub_is_dir,
-                        'size': sub_size
-                    })
+                item_count = 0
+                with os.scandir(item_path) as it:
+                    for entry in it:
+                        item_count += 1
+                        sub_size = _entry_size(entry)
+                        details['size'] += sub_size
+                        if item_count <= 20:
+                            contents.append({
+                                'name': entry.name,
+                                'is_dir': entry.is_dir(),
+                                'size': sub_size
+                            })
+                        elif item_count == 21:
+                            contents.append("... (more items not shown)")
                 
                 details['contents'] = contents
-                details['item_count'] = len(os.listdir(item_path))
+                details['item_count'] = item_count
             except (OSError, PermissionError):
                 details['contents'] = ["Error: Unable to access directory contents"]
         
@@ -171,45 +514,71 @@ def get_item_details(item_path):
         return None
 
 
+def _entry_size(entry):
+    """Size of a directory entry the way get_size counts it: symlinks are not followed."""
+    try:
+        if entry.is_dir(follow_symlinks=False):
+            return get_size(entry.path)
+        if entry.is_symlink():
+            return 0
+        return entry.stat(follow_symlinks=False).st_size
+    except (OSError, PermissionError):
+        return 0
+
+
+def details_from_item(item, directory):
+    """Build the details dict for a listed item from its cached row, without touching disk.
+    
+    Carries the fields the confirmation screens use (name, path, size, is_dir)
+    plus the modification time already held in the row.
+    """
+    name, size, is_dir, _, mtime = item
+    return {
+        'name': name,
+        'path': os.path.join(directory, name),
+        'size': size,
+        'is_dir': is_dir,
+        'modified': datetime.datetime.fromtimestamp(mtime),
+    }
+
+
+def _read_head(file_path, length):
+    """Read at most length bytes from the start of a file.
+    
+    One unbuffered read of length + 1 bytes both fetches the preview and tells
+    whether there is more, so very large files (or ones without newlines)
+    never pull more than the preview into memory.
+    
+    Returns:
+        tuple: (data, truncated)
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        data = os.read(fd, length + 1)
+    finally:
+        os.close(fd)
+    return data[:length], len(data) > length
+
+
 def get_file_preview(file_path, max_lines=10):
     """Get preview of text file contents."""
     try:
-        # Check if it's likely a text file
-        text_extensions = {'.txt', '.md', '.py', '.js', '.json', '.html', '.css', 
-                          '.xml', '.yml', '.yaml', '.sh', '.bat', '.log', '.csv',
-                          '.ini', '.cfg', '.conf', '.toml'}
-        
         ext = os.path.splitext(file_path)[1].lower()
+        kind = _PREVIEW_KINDS.get(ext, 'binary')
         
-        if ext in text_extensions:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                lines = []
-                for i, line in enumerate(f):
-                    if i >= max_lines:
-                        lines.append(f"... ({max_lines} lines shown)")
-                        break
-                    lines.append(line.rstrip())
-                return {'type': 'text', 'content': lines}
+        if kind == 'text':
+            data, truncated = _read_head(file_path, PREVIEW_BYTES)
+            text_lines = data.decode('utf-8', errors='ignore').splitlines()
+            lines = [line.rstrip() for line in text_lines[:max_lines]]
+            if len(text_lines) > max_lines or truncated:
+                lines.append(f"... ({len(lines)} lines shown)")
+            return {'type': 'text', 'content': lines}
         
-        # Image files
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg'}
-        if ext in image_extensions:
-            size = os.path.getsize(file_path)
-            return {'type': 'image', 'size': size, 'format': ext[1:].upper()}
-        
-        # Video files
-        video_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.webm', '.m4v'}
-        if ext in video_extensions:
-            size = os.path.getsize(file_path)
-            return {'type': 'video', 'size': size, 'format': ext[1:].upper()}
-        
-        # Audio files
-        audio_extensions = {'.mp3', '.wav', '.flac', '.aac', '.m4a', '.ogg'}
-        if ext in audio_extensions:
-            size = os.path.getsize(file_path)
-            return {'type': 'audio', 'size': size, 'format': ext[1:].upper()}
-        
-        return {'type': 'binary', 'size': os.path.getsize(file_path)}
+        size = os.path.getsize(file_path)
+        if kind == 'binary':
+            return {'type': 'binary', 'size': size}
+        # Image, video and audio files
+        return {'type': kind, 'size': size, 'format': ext[1:].upper()}
     
     except Exception as e:
         return {'type': 'error', 'message': str(e)}
@@ -218,11 +587,31 @@ def get_file_preview(file_path, max_lines=10):
 def invalidate_cache():
     """Invalidate the directory cache."""
     get_cache().invalidate()
+    _details_memo.clear()
+    forget_isdir()
 
 
 def remove_from_cache(item_path):
     """Remove an item from cache."""
     get_cache().remove_item(item_path)
+    _forget_details(item_path)
+    forget_isdir(item_path)
+
+
+def remove_from_cache_many(item_paths):
+    """Remove several items from cache, updating each parent listing once."""
+    get_cache().remove_items(item_paths)
+    for item_path in item_paths:
+        _forget_details(item_path)
+        forget_isdir(item_path)
+
+
+def is_directory(path):
+    """Check whether path is a directory, answering from the cache when it can."""
+    cached = get_cache().is_dir(path)
+    if cached is None:
+        return isdir_cached(path)
+    return cached
 
 
 def get_cache_scan_root():
@@ -230,59 +619,60 @@ def get_cache_scan_root():
     return get_cache().get_scan_root()
 
 
+# One comma-separated selection part: "7" or "3-9"
+_SELECTION_PART = re.compile(r'(\d+)(?:-(\d+))?')
+
+
 def parse_selection(selection_str, max_items):
-    """Parse selection string like '1,3,5' or '1-5' or '1-3,7,9' into indices."""
-    indices = set()
-    
-    parts = selection_str.replace(' ', '').split(',')
+    """Parse selection string like '1,3,5' or '1-5' or '1-3,7,9' into indices.
     
-    for part in parts:
-        if '-' in part:
-            try:
-                start, end = part.split('-')
-                start = int(start) - 1  # Convert to 0-indexed
-                end = int(end) - 1
-                for i in range(start, end + 1):
-                    if 0 <= i < max_items:
-                        indices.add(i)
-            except ValueError:
-                pass
-        else:
-            try:
-                idx = int(part) - 1  # Convert to 0-indexed
-                if 0 <= idx < max_items:
-                    indices.add(idx)
-            except ValueError:
-                pass
+    Parts are matched against a precompiled pattern and anything else is
+    ignored. Ranges are clipped to max_items, then merged in order and each
+    expanded with one range(), so the work follows the size of the selection
+    rather than max_items.
+    """
+    spans = []
+    for part in selection_str.replace(' ', '').split(','):
+        match = _SELECTION_PART.fullmatch(part)
+        if match is None:
+            continue
+        first, last = match.groups()
+        start = max(int(first) - 1, 0)  # Convert to 0-indexed
+        end = min(int(last or first), max_items)  # Exclusive bound
+        if start < end:
+            spans.append((start, end))
     
-    return sorted(list(indices))
+    spans.sort()
+    indices = []
+    reach = 0  # everything selected below this is already in indices
+    for start, end in spans:
+        if end > reach:
+            indices.extend(range(max(start, reach), end))
+            reach = end
+    return indices
 
 
 def export_report(directory, items, output_path=None):
     """Export directory analysis to CSV."""
-    import csv
-    from datetime import datetime
-    
     if output_path is None:
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
         output_path = os.path.join(os.path.expanduser('~'), f'diskman_report_{timestamp}.csv')
     
+    prefix = os.path.join(directory, '')
     try:
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
+        with open(output_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_BUFFER_SIZE) as f:
             writer = csv.writer(f)
             writer.writerow(['Name', 'Size (bytes)', 'Size (human)', 'Type', 'Hidden', 'Path'])
-            
-            for name, size, is_dir, is_hid, mtime in items:
-                import humanize
-                item_path = os.path.join(directory, name)
-                writer.writerow([
-                    name,
-                    size,
-                    humanize.naturalsize(size),
-                    'Directory' if is_dir else 'File',
-                    'Yes' if is_hid else 'No',
-                    item_path
-                ])
+            # One writerows call keeps the row loop inside the csv module
+            writer.writerows(
+                (name,
+                 size,
+                 fast_naturalsize(size),
+                 'Directory' if is_dir else 'File',
+                 'Yes' if is_hid else 'No',
+                 prefix + name)
+                for name, size, is_dir, is_hid, mtime in items
+            )
         
         return True, output_path
     except Exception as e:
@@ -4,9 +4,18 @@ System cache detection for DiskMan V3.
 Detects common cache/temp folders based on OS.
 """
 import os
+import stat
 import sys
-import shutil
-from .utils import get_size, start_spinner, stop_spinner, is_hidden
+import functools
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .utils import get_size_capped, start_spinner, stop_spinner, update_spinner_folder, is_hidden
+
+# Cache folders are sized concurrently; each one is an independent directory walk
+CACHE_SCAN_WORKERS = 16
+# Stop sizing a folder once it is known to be at least this big; it is
+# reported as "10 GB+" instead of walking every file in it
+CACHE_SIZE_CAP = 10 * 1024 ** 3
 
 # macOS cache locations
 MACOS_CACHE_PATHS = [
@@ -73,44 +82,132 @@ def get_cache_paths():
         return LINUX_CACHE_PATHS
 
 
+@functools.lru_cache(maxsize=256)
 def expand_path(path):
-    """Expand path with environment variables and home directory."""
+    """Expand path with environment variables and home directory.
+    
+    Results are remembered; call expand_path.cache_clear() after changing
+    HOME or the variables the templates use.
+    """
     path = os.path.expandvars(path)
     path = os.path.expanduser(path)
     return path
 
 
-def scan_cache_folders():
+def get_expanded_cache_paths():
+    """Get (path, name, description) for the current OS's cache folders, expanded once."""
+    paths = []
+    for template, description in get_cache_paths():
+        path = expand_path(template)
+        paths.append((path, os.path.basename(path) or path, description))
+    return paths
+
+
+def _size_cache_folder(path, name, description, size_cap=CACHE_SIZE_CAP):
+    """Size one cache folder. Returns (path, name, description, size, exists, capped)."""
+    if os.path.exists(path):
+        try:
+            size, capped = get_size_capped(path, size_cap)
+            return (path, name, description, size, True, capped)
+        except (OSError, PermissionError):
+            return (path, name, description, 0, True, False)
+    return (path, name, description, 0, False, False)
+
+
+def iter_cache_folders(max_workers=CACHE_SCAN_WORKERS, size_cap=CACHE_SIZE_CAP):
+    """Size system cache folders in parallel, yielding each one as soon as it is done.
+    
+    A folder bigger than size_cap is only walked until it passes the cap; pass
+    float('inf') for exact sizes.
+    
+    Yields: (path, name, description, size, exists, capped) for existing folders, in completion order
+    """
+    paths = get_expanded_cache_paths()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        futures = [executor.submit(_size_cache_folder, path, name, description, size_cap)
+                   for path, name, description in paths]
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except (OSError, ValueError, RecursionError):
+                # One unreadable or odd folder should not cost the rest of the scan
+                continue
+            if result[4]:
+                yield result
+
+
+def scan_cache_folders(size_cap=CACHE_SIZE_CAP):
     """Scan system cache folders and return sizes.
     
-    Returns: list of (path, name, description, size, exists)
+    Returns: list of (path, name, description, size, exists, capped); when
+    capped is True the folder holds at least size bytes
     """
     start_spinner("Scanning system cache folders...")
     
     results = []
-    paths = get_cache_paths()
+    for result in iter_cache_folders(size_cap=size_cap):
+        update_spinner_folder(result[0])
+        results.append(result)
     
-    for path_template, description in paths:
-        path = expand_path(path_template)
-        name = os.path.basename(path) or path
-        
-        if os.path.exists(path):
-            try:
-                size = get_size(path)
-                results.append((path, name, description, size, True))
-            except (OSError, PermissionError):
-                results.append((path, name, description, 0, True))
-        else:
-            results.append((path, name, description, 0, False))
-    
-    # Sort by size (largest first), only existing folders
-    results = [r for r in results if r[4]]  # Only existing
-    results.sort(key=lambda x: x[3], reverse=True)
+    # Sort by size (largest first)
+    results.sort(key=itemgetter(3), reverse=True)
     
     stop_spinner()
     return results
 
 
+def _size_and_remove(path):
+    """Delete a file or directory tree in one post-order pass, totalling what it frees.
+    
+    Each file's size comes from the lstat its directory entry needs anyway, so
+    the tree is not walked once for sizing and again for deletion. Symlinks
+    are removed, never followed.
+    
+    Returns:
+        tuple: (bytes_freed, [(path, error message), ...])
+    """
+    try:
+        st = os.lstat(path)
+    except OSError as e:
+        return 0, [(path, str(e))]
+    if not stat.S_ISDIR(st.st_mode):
+        try:
+            os.unlink(path)
+            return st.st_size, []
+        except OSError as e:
+            return 0, [(path, str(e))]
+    
+    bytes_freed = 0
+    errors = []
+    # Each directory is popped twice: first to empty it, then, once everything
+    # pushed above it is gone, to remove it
+    stack = [(path, False)]
+    while stack:
+        dir_path, emptied = stack.pop()
+        if emptied:
+            try:
+                os.rmdir(dir_path)
+            except OSError as e:
+                errors.append((dir_path, str(e)))
+            continue
+        stack.append((dir_path, True))
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, False))
+                        else:
+                            size = entry.stat(follow_symlinks=False).st_size
+                            os.unlink(entry.path)
+                            bytes_freed += size
+                    except OSError as e:
+                        errors.append((entry.path, str(e)))
+        except OSError as e:
+            errors.append((dir_path, str(e)))
+    return bytes_freed, errors
+
+
 def clear_folder(path, keep_folder=True):
     """Clear contents of a folder.
     
@@ -133,17 +230,14 @@ def clear_folder(path, keep_folder=True):
         bytes_freed = 0
         errors = []
         
-        for item in os.listdir(path):
-            item_path = os.path.join(path, item)
-            try:
-                item_size = get_size(item_path)
-                if os.path.isdir(item_path):
-                    shutil.rmtree(item_path)
-                else:
-                    os.remove(item_path)
-                bytes_freed += item_size
-            except (OSError, PermissionError) as e:
-                errors.append(f"{item}: {e}")
+        with os.scandir(path) as it:
+            item_paths = [entry.path for entry in it]
+        
+        for item_path in item_paths:
+            freed, item_errors = _size_and_remove(item_path)
+            bytes_freed += freed
+            if item_errors:
+                errors.append(f"{os.path.basename(item_path)}: {item_errors[0][1]}")
         
         stop_spinner()
         
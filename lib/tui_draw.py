@@ -1,12 +1,11 @@
 import os
 import curses
 import time
-import humanize
 from datetime import datetime
 from .curses_cache import du_cache, get_single_dir_size
 from .theme import THEMES
 from .image_compress import get_funny_loading_message
-from .utils import get_file_metadata
+from .utils import get_file_metadata, naturalsize_cached
 
 SPINNER_FRAMES = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
 __version__ = "4.2.4-curses"
@@ -252,7 +251,7 @@ def draw_screen(stdscr, current_dir, items, selected_idx, scroll_offset, spinner
         if du_cache.calculating_dirs:
             is_scanning = True
 
-    total_size_str = humanize.naturalsize(total_size)
+    total_size_str = naturalsize_cached(total_size)
     spinner_char = SPINNER_FRAMES[spinner_frame]
     status_text = f"[ {total_size_str} │ {spinner_char} SCANNING... ]" if is_scanning else f"[ {total_size_str} │ ✓ SCAN COMPLETE ]"
     status_color = curses.color_pair(4) if is_scanning else curses.color_pair(3)
@@ -320,7 +319,7 @@ def draw_screen(stdscr, current_dir, items, selected_idx, scroll_offset, spinner
         
         # Format sizes humanly
         if size >= 0:
-            size_str = humanize.naturalsize(size)
+            size_str = naturalsize_cached(size)
         else:
             size_str = "Calculating..."
             
@@ -388,7 +387,7 @@ def draw_screen(stdscr, current_dir, items, selected_idx, scroll_offset, spinner
         lines = [
             ("Name", name, curses.color_pair(1) if is_dir else curses.color_pair(2)),
             ("Type", "Directory 📁" if is_dir else "File 📄", curses.color_pair(4)),
-            ("Size", humanize.naturalsize(size) if size >= 0 else "Calculating...", curses.color_pair(3)),
+            ("Size", naturalsize_cached(size) if size >= 0 else "Calculating...", curses.color_pair(3)),
             ("Bytes", f"{size:,} B" if size >= 0 else "Computing...", curses.color_pair(3)),
             ("Modified", datetime.fromtimestamp(mtime).strftime('%y-%m-%d %H:%M') if mtime > 0 else "Unknown", curses.color_pair(2))
         ]
@@ -428,7 +427,7 @@ def draw_screen(stdscr, current_dir, items, selected_idx, scroll_offset, spinner
                                     def make_bg_task(p):
                                         def task():
                                             sz = get_single_dir_size(p)
-                                            du_cache.sizes[p] = sz
+                                            du_cache.store_dir_size(p, sz)
                                             with du_cache.calculating_dirs_lock:
                                                 if p in du_cache.calculating_dirs:
                                                     du_cache.calculating_dirs.remove(p)
@@ -464,7 +463,7 @@ def draw_screen(stdscr, current_dir, items, selected_idx, scroll_offset, spinner
                     if current_y >= height - 4:
                         break
                     
-                    sz_str = humanize.naturalsize(sf_sz) if sf_sz >= 0 else "Calculating..."
+                    sz_str = naturalsize_cached(sf_sz) if sf_sz >= 0 else "Calculating..."
                     sz_color = curses.color_pair(3) if sf_sz >= 0 else curses.color_pair(4)
                     
                     # Truncate subfolder name if it exceeds pane width
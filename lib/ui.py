@@ -3,14 +3,201 @@
 Enhanced UI for DiskMan V3.
 """
 import os
+import sys
 import time
 import shutil
-import humanize
+import threading
+import functools
 from datetime import datetime
+from operator import itemgetter
 from colorama import Fore, Style, Back
-from .utils import clear_screen
+from .utils import clear_screen, naturalsize_cached
 from .cache import get_cache
 
+# Single-keypress input: termios on POSIX terminals, msvcrt on Windows
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+# Formatted rows keyed by (id(items), page, items_per_page) -> (items, rows)
+_page_rows_cache = {}
+_PAGE_ROWS_LIMIT = 8
+# Total size of the most recently drawn listing: (items, total)
+_last_total = (None, 0)
+# Row text after the index column for the most recently drawn listing, filled
+# in as its pages are shown: (items, [str or None per item])
+_last_decorated = (None, [])
+
+
+def _listing_total(items):
+    """Sum a listing's sizes once per listing rather than once per redraw."""
+    global _last_total
+    cached_items, total = _last_total
+    if cached_items is not items:
+        # map/itemgetter reads the size column without a Python-level loop
+        total = sum(map(itemgetter(1), items)) if items else 0
+        _last_total = (items, total)
+    return total
+
+
+def _emit(lines):
+    """Write a screen's lines to stdout in one call instead of a print per line."""
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
+
+# Escape sequences for listing rows, joined once at import instead of per row.
+# colorama's constants are plain ANSI strings on every platform.
+_RESET = Style.RESET_ALL
+_INDEX_COLOR = Fore.YELLOW
+# (is_dir, is_hidden) -> (name color, type icon)
+_NAME_STYLES = {
+    (True, True): (Fore.CYAN + Style.DIM, "📁"),
+    (True, False): (Fore.CYAN + Style.BRIGHT, "📁"),
+    (False, True): (Fore.WHITE + Style.DIM, "📄"),
+    (False, False): (Fore.WHITE + Style.BRIGHT, "📄"),
+}
+_AGE_LABELS = {
+    'old': f"{Fore.RED}◉ old{_RESET}",
+    'medium': f"{Fore.YELLOW}◉ mid{_RESET}",
+    'new': f"{Fore.GREEN}◉ new{_RESET}",
+}
+# Row layouts with the constant escapes baked in, filled with %:
+# (name color, name, size color, size, pct color, pct, type icon, age label)
+_ROW_TEMPLATE = ("%s%-38s" + _RESET + " %s%-12s" + _RESET + " %s%-6s" + _RESET +
+                 " %-8s %s")
+# Index column; the rest of the row is appended as is
+_INDEX_TEMPLATE = _INDEX_COLOR + "%-4d "
+
+
+def _decorated_rows(items):
+    """Return the per-item row cache for a listing, starting a fresh one for a new listing."""
+    global _last_decorated
+    cached_items, decorated = _last_decorated
+    if cached_items is not items:
+        decorated = [None] * len(items)
+        _last_decorated = (items, decorated)
+    return decorated
+
+
+def _decorate_row(item, total_size, cache, now):
+    """Format everything in a listing row after the index column."""
+    name, size, is_dir, is_hid, mtime = item
+    
+    # Truncate name
+    if len(name) > 35:
+        display_name = name[:32] + "..."
+    else:
+        display_name = name
+
+    size_str = naturalsize_cached(size)
+    
+    # Colors based on type and visibility
+    name_color, type_str = _NAME_STYLES[bool(is_dir), bool(is_hid)]
+
+    # Percentage and color
+    percentage = (size / total_size * 100) if total_size > 0 else 0
+    if percentage > 10:
+        size_color = Fore.RED
+    elif percentage > 5:
+        size_color = Fore.YELLOW
+    else:
+        size_color = Fore.GREEN
+    pct_str = f"{percentage:.1f}%"
+
+    # Age indicator
+    age_str = _AGE_LABELS.get(cache.get_age_color(mtime, now), _AGE_LABELS['new'])
+
+    return _ROW_TEMPLATE % (name_color, display_name, size_color, size_str,
+                            size_color, pct_str, type_str, age_str)
+
+
+def _format_page_rows(items, page, items_per_page):
+    """Format the listing rows for one page of items.
+    
+    Only the index column depends on the page; the rest of each row is
+    formatted the first time its item is shown and reused until the listing
+    changes, so paging back and forth or redrawing costs no formatting.
+    """
+    start_idx = page * items_per_page
+    end_idx = min(start_idx + items_per_page, len(items))
+    total_size = _listing_total(items)
+    decorated = _decorated_rows(items)
+    cache = get_cache()
+    now = time.time()
+    index_template = _INDEX_TEMPLATE
+    rows = []
+
+    for idx in range(start_idx, end_idx):
+        row = decorated[idx]
+        if row is None:
+            row = decorated[idx] = _decorate_row(items[idx], total_size, cache, now)
+        rows.append(index_template % (idx + 1) + row)
+
+    return rows
+
+
+def _get_page_rows(items, page, items_per_page):
+    """Return formatted rows for a page, reusing a prefetched copy when available."""
+    key = (id(items), page, items_per_page)
+    entry = _page_rows_cache.get(key)
+    if entry is not None and entry[0] is items:
+        return entry[1]
+    rows = _format_page_rows(items, page, items_per_page)
+    _store_page_rows(key, items, rows)
+    return rows
+
+
+def _store_page_rows(key, items, rows):
+    """Remember formatted rows, dropping old pages once the cache is full."""
+    if len(_page_rows_cache) >= _PAGE_ROWS_LIMIT:
+        _page_rows_cache.clear()
+    _page_rows_cache[key] = (items, rows)
+
+
+def prefetch_page(items, page, items_per_page=20):
+    """Format a page in the background so paging to it does not wait on formatting.
+    
+    Call this after drawing a page and before blocking on input; the rows are
+    picked up by display_directory if the user moves to that page.
+    """
+    if page < 0 or page * items_per_page >= len(items):
+        return None
+    key = (id(items), page, items_per_page)
+    entry = _page_rows_cache.get(key)
+    if entry is not None and entry[0] is items:
+        return None
+    
+    def _precompute():
+        _store_page_rows(key, items, _format_page_rows(items, page, items_per_page))
+    
+    thread = threading.Thread(target=_precompute, daemon=True)
+    thread.start()
+    return thread
+
+
+@functools.lru_cache(maxsize=8)
+def _frame_lines(width):
+    """Colored box edges and rule for a listing width, built once per terminal width.
+    
+    Fixed-width rules elsewhere are folded into constants by the compiler;
+    these depend on the terminal size, so they are remembered instead.
+    
+    Returns: (box top, box divider, box bottom, horizontal rule)
+    """
+    bar = '═' * (width - 2)
+    return (f"\n{Fore.CYAN}╔{bar}╗{Style.RESET_ALL}",
+            f"{Fore.CYAN}╠{bar}╣{Style.RESET_ALL}",
+            f"{Fore.CYAN}╚{bar}╝{Style.RESET_ALL}",
+            f"{Fore.BLUE}{'─' * width}{Style.RESET_ALL}")
+
 
 def display_directory(directory, items, page=0, items_per_page=20, is_cached=False, 
                       sort_mode='size', show_hidden=True, filter_text=None):
@@ -18,11 +205,9 @@ def display_directory(directory, items, page=0, items_per_page=20, is_cached=Fal
     total_items = len(items)
     total_pages = (total_items + items_per_page - 1) // items_per_page
     page = max(0, min(page, total_pages - 1)) if total_pages > 0 else 0
-    start_idx = page * items_per_page
-    end_idx = min(start_idx + items_per_page, total_items)
-    page_items = items[start_idx:end_idx]
 
     clear_screen()
+    out = []
     
     # Get terminal width dynamically (min 80, max 120 for readability)
     term_width = shutil.get_terminal_size().columns
@@ -47,80 +232,34 @@ def display_directory(directory, items, page=0, items_per_page=20, is_cached=Fal
     path_display = directory[:max_path_len] if len(directory) > max_path_len else directory
     path_padding = width - 5 - len(path_display) - 1  # -1 for 📁 emoji
     
-    print(f"\n{Fore.CYAN}╔{'═' * (width-2)}╗{Style.RESET_ALL}")
+    box_top, box_divider, box_bottom, rule = _frame_lines(width)
+    out.append(box_top)
     
     # Title line with colors
     if filter_text:
-        print(f"{Fore.CYAN}║{Style.RESET_ALL} {Fore.WHITE}{Style.BRIGHT}DISKMAN V3{Style.RESET_ALL}  {cache_color}{cache_icon}{Style.RESET_ALL}  {Fore.YELLOW}[{sort_char}]{Style.RESET_ALL} {hidden_icon}  {Fore.MAGENTA}🔍 {filter_text}{Style.RESET_ALL}{' ' * title_padding}{Fore.CYAN}║{Style.RESET_ALL}")
+        out.append(f"{Fore.CYAN}║{Style.RESET_ALL} {Fore.WHITE}{Style.BRIGHT}DISKMAN V3{Style.RESET_ALL}  {cache_color}{cache_icon}{Style.RESET_ALL}  {Fore.YELLOW}[{sort_char}]{Style.RESET_ALL} {hidden_icon}  {Fore.MAGENTA}🔍 {filter_text}{Style.RESET_ALL}{' ' * title_padding}{Fore.CYAN}║{Style.RESET_ALL}")
     else:
-        print(f"{Fore.CYAN}║{Style.RESET_ALL} {Fore.WHITE}{Style.BRIGHT}DISKMAN V3{Style.RESET_ALL}  {cache_color}{cache_icon}{Style.RESET_ALL}  {Fore.YELLOW}[{sort_char}]{Style.RESET_ALL} {hidden_icon}{' ' * title_padding}{Fore.CYAN}║{Style.RESET_ALL}")
+        out.append(f"{Fore.CYAN}║{Style.RESET_ALL} {Fore.WHITE}{Style.BRIGHT}DISKMAN V3{Style.RESET_ALL}  {cache_color}{cache_icon}{Style.RESET_ALL}  {Fore.YELLOW}[{sort_char}]{Style.RESET_ALL} {hidden_icon}{' ' * title_padding}{Fore.CYAN}║{Style.RESET_ALL}")
     
-    print(f"{Fore.CYAN}╠{'═' * (width-2)}╣{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}║{Style.RESET_ALL} {Fore.GREEN}📁{Style.RESET_ALL} {Fore.WHITE}{Style.BRIGHT}{path_display}{Style.RESET_ALL}{' ' * path_padding}{Fore.CYAN}║{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}╚{'═' * (width-2)}╝{Style.RESET_ALL}")
+    out.append(box_divider)
+    out.append(f"{Fore.CYAN}║{Style.RESET_ALL} {Fore.GREEN}📁{Style.RESET_ALL} {Fore.WHITE}{Style.BRIGHT}{path_display}{Style.RESET_ALL}{' ' * path_padding}{Fore.CYAN}║{Style.RESET_ALL}")
+    out.append(box_bottom)
     
     # Column headers
-    print(f"{Fore.GREEN}{Style.BRIGHT}{'#':<4} {'Name':<38} {'Size':<12} {'%':<6} {'Type':<8} {'Age':<8}{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * width}{Style.RESET_ALL}")
-
-    total_size = sum(item[1] for item in items) if items else 0
-    cache = get_cache()
+    out.append(f"{Fore.GREEN}{Style.BRIGHT}{'#':<4} {'Name':<38} {'Size':<12} {'%':<6} {'Type':<8} {'Age':<8}{Style.RESET_ALL}")
+    out.append(rule)
 
-    for i, item in enumerate(page_items, start_idx + 1):
-        name, size, is_dir, is_hid, mtime = item
-        
-        # Truncate name
-        if len(name) > 35:
-            display_name = name[:32] + "..."
-        else:
-            display_name = name
-
-        size_str = humanize.naturalsize(size)
-        
-        # Colors based on type and visibility
-        if is_dir and is_hid:
-            name_color = Fore.CYAN + Style.DIM
-            type_str = "📁"
-        elif is_dir:
-            name_color = Fore.CYAN + Style.BRIGHT
-            type_str = "📁"
-        elif is_hid:
-            name_color = Fore.WHITE + Style.DIM
-            type_str = "📄"
-        else:
-            name_color = Fore.WHITE + Style.BRIGHT
-            type_str = "📄"
+    total_size = _listing_total(items)
 
-        # Percentage and color
-        percentage = (size / total_size * 100) if total_size > 0 else 0
-        if percentage > 10:
-            pct_color = Fore.RED
-            size_color = Fore.RED
-        elif percentage > 5:
-            pct_color = Fore.YELLOW
-            size_color = Fore.YELLOW
-        else:
-            pct_color = Fore.GREEN
-            size_color = Fore.GREEN
-        pct_str = f"{percentage:.1f}%"
-
-        # Age indicator
-        age_cat = cache.get_age_color(mtime)
-        if age_cat == 'old':
-            age_str = f"{Fore.RED}◉ old{Style.RESET_ALL}"
-        elif age_cat == 'medium':
-            age_str = f"{Fore.YELLOW}◉ mid{Style.RESET_ALL}"
-        else:
-            age_str = f"{Fore.GREEN}◉ new{Style.RESET_ALL}"
+    out.extend(_get_page_rows(items, page, items_per_page))
 
-        print(f"{Fore.YELLOW}{i:<4} {name_color}{display_name:<38}{Style.RESET_ALL} "
-              f"{size_color}{size_str:<12}{Style.RESET_ALL} {pct_color}{pct_str:<6}{Style.RESET_ALL} "
-              f"{type_str:<8} {age_str}")
+    out.append(rule)
+    out.append(f"{Fore.CYAN}Total: {Fore.YELLOW}{naturalsize_cached(total_size)}{Fore.CYAN} │ "
+               f"Items: {Fore.WHITE}{total_items}{Fore.CYAN} │ "
+               f"Page: {Fore.WHITE}{page + 1}/{total_pages or 1}{Style.RESET_ALL}")
 
-    print(f"{Fore.BLUE}{'─' * width}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}Total: {Fore.YELLOW}{humanize.naturalsize(total_size)}{Fore.CYAN} │ "
-          f"Items: {Fore.WHITE}{total_items}{Fore.CYAN} │ "
-          f"Page: {Fore.WHITE}{page + 1}/{total_pages or 1}{Style.RESET_ALL}")
+    # Emit the whole screen in a single write
+    _emit(out)
 
 
 def show_navigation_options(current_page, total_pages, show_hidden=True, sort_mode='size'):
@@ -146,6 +285,69 @@ def show_navigation_options(current_page, total_pages, show_hidden=True, sort_mo
     print(f"{Fore.BLUE}─{Style.RESET_ALL} {Fore.YELLOW}top{Style.RESET_ALL} {Fore.YELLOW}dup{Style.RESET_ALL} {Fore.YELLOW}clean{Style.RESET_ALL} {Fore.GREEN}web{Style.RESET_ALL} {Fore.YELLOW}r{Style.RESET_ALL}=rescan {Fore.CYAN}?{Style.RESET_ALL}=help {Fore.RED}q{Style.RESET_ALL}=quit")
 
 
+# Commands that are complete in one keystroke; no longer command starts with these
+HOTKEYS = frozenset('qr~snpex?')
+
+
+def _read_key():
+    """Read one keypress without waiting for Enter, or return None if stdin is not a terminal."""
+    if not sys.stdin.isatty():
+        return None
+    if msvcrt is not None:
+        return msvcrt.getwch()
+    if termios is None:
+        return None
+    fd = sys.stdin.fileno()
+    old_attrs = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        data = os.read(fd, 1)
+        # Pull in the rest of a multi-byte UTF-8 character
+        if data and data[0] >= 0xC0:
+            data += os.read(fd, 1 if data[0] < 0xE0 else 2 if data[0] < 0xF0 else 3)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+    return data.decode('utf-8', 'replace')
+
+
+def read_command(prompt):
+    """Prompt for a command, acting on HOTKEYS as soon as they are pressed.
+    
+    Any other first key starts a normal line of input (with that key already
+    typed), so commands like 'g ~/Downloads' or 'd 1-3' still end with Enter.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    key = _read_key()
+    if key is None:
+        return input()
+    if key == '':
+        raise EOFError
+    if key in ('\r', '\n'):
+        sys.stdout.write('\n')
+        return ''
+    if key in HOTKEYS:
+        sys.stdout.write(key + '\n')
+        return key
+    
+    try:
+        import readline
+    except ImportError:
+        readline = None
+    if readline is None:
+        sys.stdout.write(key)
+        sys.stdout.flush()
+        return key + input()
+    
+    # Redraw the prompt through readline with the key pre-typed, so it can be edited
+    sys.stdout.write('\r\033[K')
+    readline.set_startup_hook(lambda: readline.insert_text(key))
+    try:
+        return input(prompt.rsplit('\n', 1)[-1])
+    finally:
+        readline.set_startup_hook()
+
+
 def show_help():
     """Display full help/tutorial page."""
     clear_screen()
@@ -288,10 +490,11 @@ def show_welcome_message(version=None, update_available=False):
 def show_extension_stats(stats, total_size):
     """Display extension breakdown."""
     clear_screen()
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}📊 Extension Statistics{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 60}{Style.RESET_ALL}")
-    print(f"{Fore.GREEN}{Style.BRIGHT}{'Extension':<20} {'Size':<15} {'%':>8}{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 60}{Style.RESET_ALL}")
+    out = []
+    out.append(f"\n{Fore.CYAN}{Style.BRIGHT}📊 Extension Statistics{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 60}{Style.RESET_ALL}")
+    out.append(f"{Fore.GREEN}{Style.BRIGHT}{'Extension':<20} {'Size':<15} {'%':>8}{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 60}{Style.RESET_ALL}")
     
     for ext, size in stats.items():
         pct = (size / total_size * 100) if total_size > 0 else 0
@@ -306,29 +509,32 @@ def show_extension_stats(stats, total_size):
         bar_len = int(pct / 2)
         bar = "█" * bar_len
         
-        print(f"{Fore.WHITE}{ext:<20} {color}{humanize.naturalsize(size):<15} "
-              f"{pct:>6.1f}% {bar}{Style.RESET_ALL}")
+        out.append(f"{Fore.WHITE}{ext:<20} {color}{naturalsize_cached(size):<15} "
+                   f"{pct:>6.1f}% {bar}{Style.RESET_ALL}")
     
-    print(f"{Fore.BLUE}{'─' * 60}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}Total: {Fore.YELLOW}{humanize.naturalsize(total_size)}{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 60}{Style.RESET_ALL}")
+    out.append(f"{Fore.CYAN}Total: {Fore.YELLOW}{naturalsize_cached(total_size)}{Style.RESET_ALL}")
+    _emit(out)
     input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
 
 
 def show_bookmarks(bookmarks):
     """Display bookmarks list."""
     clear_screen()
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}🔖 Bookmarks{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 60}{Style.RESET_ALL}")
+    out = []
+    out.append(f"\n{Fore.CYAN}{Style.BRIGHT}🔖 Bookmarks{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 60}{Style.RESET_ALL}")
     
     if not bookmarks:
-        print(f"{Fore.YELLOW}No bookmarks yet. Use 'b+' to add current directory.{Style.RESET_ALL}")
+        out.append(f"{Fore.YELLOW}No bookmarks yet. Use 'b+' to add current directory.{Style.RESET_ALL}")
     else:
         for idx, path in bookmarks:
-            name = os.path.basename(path) or path
-            print(f"  {Fore.YELLOW}{idx}{Fore.CYAN}: {Fore.WHITE}{name}{Style.RESET_ALL}")
-            print(f"      {Fore.WHITE}{Style.DIM}{path}{Style.RESET_ALL}")
+            name = os.path.split(path)[1] or path
+            out.append(f"  {Fore.YELLOW}{idx}{Fore.CYAN}: {Fore.WHITE}{name}{Style.RESET_ALL}")
+            out.append(f"      {Fore.WHITE}{Style.DIM}{path}{Style.RESET_ALL}")
     
-    print(f"\n{Fore.CYAN}Commands: {Fore.YELLOW}b#=jump  b+=add  b- #=remove{Style.RESET_ALL}")
+    out.append(f"\n{Fore.CYAN}Commands: {Fore.YELLOW}b#=jump  b+=add  b- #=remove{Style.RESET_ALL}")
+    _emit(out)
     return input(f"{Fore.YELLOW}> {Style.RESET_ALL}").strip()
 
 
@@ -338,11 +544,13 @@ def show_duplicates(duplicates):
     Returns: action tuple or None
     """
     clear_screen()
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}🔍 DUPLICATE FILES{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out = []
+    out.append(f"\n{Fore.CYAN}{Style.BRIGHT}🔍 DUPLICATE FILES{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
     
     if not duplicates:
-        print(f"\n{Fore.GREEN}✓ No duplicates found! Your files are unique.{Style.RESET_ALL}")
+        out.append(f"\n{Fore.GREEN}✓ No duplicates found! Your files are unique.{Style.RESET_ALL}")
+        _emit(out)
         input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
         return None
     
@@ -350,12 +558,12 @@ def show_duplicates(duplicates):
     total_wasted = sum(d.get('wasted', d['size'] * (len(d['files']) - 1)) for d in duplicates)
     total_groups = len(duplicates)
     
-    print(f"{Fore.RED}{Style.BRIGHT}Found {total_groups} duplicate groups  •  Potential savings: {humanize.naturalsize(total_wasted)}{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out.append(f"{Fore.RED}{Style.BRIGHT}Found {total_groups} duplicate groups  •  Potential savings: {naturalsize_cached(total_wasted)}{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
     
     # Show header
-    print(f"{Fore.GREEN}{Style.BRIGHT}{'#':<4} {'Wasted':<12} {'Each':<12} {'Copies':<8} {'Filename'}{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out.append(f"{Fore.GREEN}{Style.BRIGHT}{'#':<4} {'Wasted':<12} {'Each':<12} {'Copies':<8} {'Filename'}{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
     
     # Show top duplicates (limit to 15)
     display_dups = duplicates[:15]
@@ -366,7 +574,7 @@ def show_duplicates(duplicates):
         wasted = dup.get('wasted', size * (count - 1))
         
         # Get filename (they're all the same name for true duplicates)
-        filename = os.path.basename(files[0])
+        filename = os.path.split(files[0])[1]
         if len(filename) > 40:
             filename = filename[:37] + "..."
         
@@ -378,18 +586,19 @@ def show_duplicates(duplicates):
         else:
             waste_color = Fore.WHITE
         
-        print(f"{Fore.YELLOW}{i:<4}{Style.RESET_ALL} "
-              f"{waste_color}{humanize.naturalsize(wasted):<12}{Style.RESET_ALL} "
-              f"{Fore.WHITE}{humanize.naturalsize(size):<12}{Style.RESET_ALL} "
-              f"{Fore.CYAN}{count:<8}{Style.RESET_ALL} "
-              f"{Fore.WHITE}{filename}{Style.RESET_ALL}")
+        out.append(f"{Fore.YELLOW}{i:<4}{Style.RESET_ALL} "
+                   f"{waste_color}{naturalsize_cached(wasted):<12}{Style.RESET_ALL} "
+                   f"{Fore.WHITE}{naturalsize_cached(size):<12}{Style.RESET_ALL} "
+                   f"{Fore.CYAN}{count:<8}{Style.RESET_ALL} "
+                   f"{Fore.WHITE}{filename}{Style.RESET_ALL}")
     
     if len(duplicates) > 15:
-        print(f"\n{Fore.WHITE}{Style.DIM}... and {len(duplicates) - 15} more groups{Style.RESET_ALL}")
+        out.append(f"\n{Fore.WHITE}{Style.DIM}... and {len(duplicates) - 15} more groups{Style.RESET_ALL}")
     
-    print(f"\n{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}Commands:{Style.RESET_ALL} {Fore.YELLOW}#{Style.RESET_ALL}=view details  {Fore.WHITE}Enter{Style.RESET_ALL}=back")
+    out.append(f"\n{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out.append(f"{Fore.CYAN}Commands:{Style.RESET_ALL} {Fore.YELLOW}#{Style.RESET_ALL}=view details  {Fore.WHITE}Enter{Style.RESET_ALL}=back")
     
+    _emit(out)
     choice = input(f"{Fore.YELLOW}> {Style.RESET_ALL}").strip()
     
     if choice.isdigit():
@@ -403,30 +612,31 @@ def show_duplicates(duplicates):
 def show_duplicate_detail(dup):
     """Show detailed view of a duplicate group with actions."""
     clear_screen()
+    out = []
     size = dup['size']
     files = dup['files']
     wasted = dup.get('wasted', size * (len(files) - 1))
     
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}📋 DUPLICATE GROUP DETAILS{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
-    print(f"{Fore.WHITE}File size: {Fore.YELLOW}{humanize.naturalsize(size)}{Style.RESET_ALL}  •  "
-          f"{Fore.WHITE}Copies: {Fore.CYAN}{len(files)}{Style.RESET_ALL}  •  "
-          f"{Fore.WHITE}Wasted: {Fore.RED}{humanize.naturalsize(wasted)}{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out.append(f"\n{Fore.CYAN}{Style.BRIGHT}📋 DUPLICATE GROUP DETAILS{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out.append(f"{Fore.WHITE}File size: {Fore.YELLOW}{naturalsize_cached(size)}{Style.RESET_ALL}  •  "
+               f"{Fore.WHITE}Copies: {Fore.CYAN}{len(files)}{Style.RESET_ALL}  •  "
+               f"{Fore.WHITE}Wasted: {Fore.RED}{naturalsize_cached(wasted)}{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
     
-    print(f"\n{Fore.GREEN}{Style.BRIGHT}{'#':<4} {'Location'}{Style.RESET_ALL}")
+    out.append(f"\n{Fore.GREEN}{Style.BRIGHT}{'#':<4} {'Location'}{Style.RESET_ALL}")
     
     for i, filepath in enumerate(files, 1):
-        filename = os.path.basename(filepath)
-        dirname = os.path.dirname(filepath)
+        dirname, filename = os.path.split(filepath)
         if len(dirname) > 80:
             dirname = "..." + dirname[-77:]
-        print(f"{Fore.YELLOW}{i:<4}{Style.RESET_ALL} {Fore.WHITE}{filename}{Style.RESET_ALL}")
-        print(f"     {Fore.WHITE}{Style.DIM}{dirname}{Style.RESET_ALL}")
+        out.append(f"{Fore.YELLOW}{i:<4}{Style.RESET_ALL} {Fore.WHITE}{filename}{Style.RESET_ALL}")
+        out.append(f"     {Fore.WHITE}{Style.DIM}{dirname}{Style.RESET_ALL}")
     
-    print(f"\n{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}Commands:{Style.RESET_ALL} {Fore.YELLOW}#{Style.RESET_ALL}=go to folder  {Fore.YELLOW}o #{Style.RESET_ALL}=open in Finder  {Fore.WHITE}Enter{Style.RESET_ALL}=back")
+    out.append(f"\n{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out.append(f"{Fore.CYAN}Commands:{Style.RESET_ALL} {Fore.YELLOW}#{Style.RESET_ALL}=go to folder  {Fore.YELLOW}o #{Style.RESET_ALL}=open in Finder  {Fore.WHITE}Enter{Style.RESET_ALL}=back")
     
+    _emit(out)
     choice = input(f"{Fore.YELLOW}> {Style.RESET_ALL}").strip()
     
     if choice.startswith('o ') and choice[2:].isdigit():
@@ -447,22 +657,26 @@ def show_cache_cleaner(cache_folders):
     Returns: action tuple or None
     """
     clear_screen()
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}🧹 SYSTEM CACHE CLEANER{Style.RESET_ALL}")
-    print(f"{Fore.WHITE}Common cache/temp folders on your system:{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out = []
+    out.append(f"\n{Fore.CYAN}{Style.BRIGHT}🧹 SYSTEM CACHE CLEANER{Style.RESET_ALL}")
+    out.append(f"{Fore.WHITE}Common cache/temp folders on your system:{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
     
     if not cache_folders:
-        print(f"\n{Fore.YELLOW}No cache folders found.{Style.RESET_ALL}")
+        out.append(f"\n{Fore.YELLOW}No cache folders found.{Style.RESET_ALL}")
+        _emit(out)
         input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
         return None
     
     total_size = sum(f[3] for f in cache_folders)
+    # Folders past the scan's size cap were not walked to the end
+    any_capped = any(f[5] for f in cache_folders)
     
-    print(f"{Fore.GREEN}{Style.BRIGHT}{'#':<3} {'Size':<12} {'Folder':<30} {'Description'}{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out.append(f"{Fore.GREEN}{Style.BRIGHT}{'#':<3} {'Size':<12} {'Folder':<30} {'Description'}{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
     
-    for i, (path, name, description, size, exists) in enumerate(cache_folders, 1):
-        size_str = humanize.naturalsize(size)
+    for i, (path, name, description, size, exists, capped) in enumerate(cache_folders, 1):
+        size_str = naturalsize_cached(size) + ('+' if capped else '')
         
         # Size color
         if size > 1024 * 1024 * 1024:  # > 1GB
@@ -486,14 +700,15 @@ def show_cache_cleaner(cache_folders):
         else:
             name_display = name
         
-        print(f"{Fore.YELLOW}{i:<3} {size_color}{size_str:<12}{Style.RESET_ALL} "
-              f"{Fore.CYAN}{name_display:<30}{Style.RESET_ALL} {Fore.WHITE}{desc_display}{Style.RESET_ALL}")
+        out.append(f"{Fore.YELLOW}{i:<3} {size_color}{size_str:<12}{Style.RESET_ALL} "
+                   f"{Fore.CYAN}{name_display:<30}{Style.RESET_ALL} {Fore.WHITE}{desc_display}{Style.RESET_ALL}")
     
-    print(f"\n{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}Total cache: {Fore.YELLOW}{Style.BRIGHT}{humanize.naturalsize(total_size)}{Style.RESET_ALL}")
-    print(f"\n{Fore.CYAN}Commands:{Style.RESET_ALL}")
-    print(f"  {Fore.YELLOW}#{Style.RESET_ALL}=navigate  {Fore.YELLOW}o #{Style.RESET_ALL}=open in Finder  {Fore.RED}c #{Style.RESET_ALL}=CLEAR folder  {Fore.WHITE}Enter{Style.RESET_ALL}=back")
+    out.append(f"\n{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out.append(f"{Fore.CYAN}Total cache: {Fore.YELLOW}{Style.BRIGHT}{naturalsize_cached(total_size)}{'+' if any_capped else ''}{Style.RESET_ALL}")
+    out.append(f"\n{Fore.CYAN}Commands:{Style.RESET_ALL}")
+    out.append(f"  {Fore.YELLOW}#{Style.RESET_ALL}=navigate  {Fore.YELLOW}o #{Style.RESET_ALL}=open in Finder  {Fore.RED}c #{Style.RESET_ALL}=CLEAR folder  {Fore.WHITE}Enter{Style.RESET_ALL}=back")
     
+    _emit(out)
     choice = input(f"{Fore.YELLOW}> {Style.RESET_ALL}").strip()
     
     if choice.startswith('o ') and choice[2:].isdigit():
@@ -518,19 +733,21 @@ def show_largest_files(files, scan_root):
     Returns: action tuple or None
     """
     clear_screen()
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}📊 LARGEST FILES{Style.RESET_ALL}")
-    print(f"{Fore.WHITE}Scanning: {scan_root}{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out = []
+    out.append(f"\n{Fore.CYAN}{Style.BRIGHT}📊 LARGEST FILES{Style.RESET_ALL}")
+    out.append(f"{Fore.WHITE}Scanning: {scan_root}{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
     
     if not files:
-        print(f"\n{Fore.YELLOW}No files found in cache.{Style.RESET_ALL}")
+        out.append(f"\n{Fore.YELLOW}No files found in cache.{Style.RESET_ALL}")
+        _emit(out)
         input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
         return None
     
     total_size = sum(f[2] for f in files)
     
-    print(f"{Fore.GREEN}{Style.BRIGHT}{'#':<4} {'Name':<35} {'Size':<12} {'%':<6} {'Location'}{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out.append(f"{Fore.GREEN}{Style.BRIGHT}{'#':<4} {'Name':<35} {'Size':<12} {'%':<6} {'Location'}{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
     
     for i, (full_path, name, size, is_hid, mtime, rel_path) in enumerate(files, 1):
         # Truncate name
@@ -539,7 +756,7 @@ def show_largest_files(files, scan_root):
         else:
             display_name = name
         
-        size_str = humanize.naturalsize(size)
+        size_str = naturalsize_cached(size)
         pct = (size / total_size * 100) if total_size > 0 else 0
         
         # Size color
@@ -554,14 +771,15 @@ def show_largest_files(files, scan_root):
         if len(rel_path) > 35:
             rel_path = "..." + rel_path[-32:]
         
-        print(f"{Fore.YELLOW}{i:<4} {Fore.WHITE}{display_name:<35}{Style.RESET_ALL} "
-              f"{size_color}{size_str:<12}{Style.RESET_ALL} {size_color}{pct:>5.1f}%{Style.RESET_ALL} "
-              f"{Fore.WHITE}{rel_path}{Style.RESET_ALL}")
+        out.append(f"{Fore.YELLOW}{i:<4} {Fore.WHITE}{display_name:<35}{Style.RESET_ALL} "
+                   f"{size_color}{size_str:<12}{Style.RESET_ALL} {size_color}{pct:>5.1f}%{Style.RESET_ALL} "
+                   f"{Fore.WHITE}{rel_path}{Style.RESET_ALL}")
     
-    print(f"\n{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}Top {len(files)} files: {Fore.YELLOW}{humanize.naturalsize(total_size)}{Style.RESET_ALL}")
-    print(f"\n{Fore.CYAN}Commands: {Fore.YELLOW}#{Style.RESET_ALL}=go to folder  {Fore.YELLOW}o #{Style.RESET_ALL}=open  {Fore.YELLOW}d #{Style.RESET_ALL}=delete  {Fore.WHITE}Enter{Style.RESET_ALL}=back")
+    out.append(f"\n{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out.append(f"{Fore.CYAN}Top {len(files)} files: {Fore.YELLOW}{naturalsize_cached(total_size)}{Style.RESET_ALL}")
+    out.append(f"\n{Fore.CYAN}Commands: {Fore.YELLOW}#{Style.RESET_ALL}=go to folder  {Fore.YELLOW}o #{Style.RESET_ALL}=open  {Fore.YELLOW}d #{Style.RESET_ALL}=delete  {Fore.WHITE}Enter{Style.RESET_ALL}=back")
     
+    _emit(out)
     choice = input(f"{Fore.YELLOW}> {Style.RESET_ALL}").strip()
     
     if choice.startswith('o ') and choice[2:].isdigit():
@@ -586,17 +804,19 @@ def show_search_results(results, search_text, scan_root):
     Returns: selected path to navigate to, or None
     """
     clear_screen()
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}🔍 Search Results for '{search_text}'{Style.RESET_ALL}")
-    print(f"{Fore.WHITE}Searching in: {scan_root}{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out = []
+    out.append(f"\n{Fore.CYAN}{Style.BRIGHT}🔍 Search Results for '{search_text}'{Style.RESET_ALL}")
+    out.append(f"{Fore.WHITE}Searching in: {scan_root}{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
     
     if not results:
-        print(f"\n{Fore.YELLOW}No files found matching '{search_text}'{Style.RESET_ALL}")
+        out.append(f"\n{Fore.YELLOW}No files found matching '{search_text}'{Style.RESET_ALL}")
+        _emit(out)
         input(f"\n{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
         return None
     
-    print(f"{Fore.GREEN}{Style.BRIGHT}{'#':<4} {'Name':<35} {'Size':<12} {'Location'}{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out.append(f"{Fore.GREEN}{Style.BRIGHT}{'#':<4} {'Name':<35} {'Size':<12} {'Location'}{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
     
     # Show up to 20 results
     display_results = results[:20]
@@ -608,7 +828,7 @@ def show_search_results(results, search_text, scan_root):
         else:
             display_name = name
         
-        size_str = humanize.naturalsize(size)
+        size_str = naturalsize_cached(size)
         
         # Color based on type
         if is_dir:
@@ -622,16 +842,17 @@ def show_search_results(results, search_text, scan_root):
         if len(rel_path) > 40:
             rel_path = "..." + rel_path[-37:]
         
-        print(f"{Fore.YELLOW}{i:<4} {type_icon} {name_color}{display_name:<32}{Style.RESET_ALL} "
-              f"{Fore.GREEN}{size_str:<12}{Style.RESET_ALL} {Fore.WHITE}{rel_path}{Style.RESET_ALL}")
+        out.append(f"{Fore.YELLOW}{i:<4} {type_icon} {name_color}{display_name:<32}{Style.RESET_ALL} "
+                   f"{Fore.GREEN}{size_str:<12}{Style.RESET_ALL} {Fore.WHITE}{rel_path}{Style.RESET_ALL}")
     
     if len(results) > 20:
-        print(f"\n{Fore.YELLOW}... and {len(results) - 20} more results{Style.RESET_ALL}")
+        out.append(f"\n{Fore.YELLOW}... and {len(results) - 20} more results{Style.RESET_ALL}")
     
-    print(f"\n{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}Total: {Fore.WHITE}{len(results)} matches{Style.RESET_ALL}")
-    print(f"\n{Fore.CYAN}Enter # to go to folder, 'o #' to open in Finder, or press Enter to cancel:{Style.RESET_ALL}")
+    out.append(f"\n{Fore.BLUE}{'─' * 100}{Style.RESET_ALL}")
+    out.append(f"{Fore.CYAN}Total: {Fore.WHITE}{len(results)} matches{Style.RESET_ALL}")
+    out.append(f"\n{Fore.CYAN}Enter # to go to folder, 'o #' to open in Finder, or press Enter to cancel:{Style.RESET_ALL}")
     
+    _emit(out)
     choice = input(f"{Fore.YELLOW}> {Style.RESET_ALL}").strip()
     
     if choice.startswith('o ') and choice[2:].isdigit():
@@ -650,15 +871,16 @@ def show_search_results(results, search_text, scan_root):
 def show_delete_confirmation(item_details, use_trash=True):
     """Show deletion confirmation for single or multiple items."""
     clear_screen()
+    out = []
     
     items = item_details if isinstance(item_details, list) else [item_details]
     
     action = "Move to Trash" if use_trash else "PERMANENTLY DELETE"
     color = Fore.YELLOW if use_trash else Fore.RED
     
-    print(f"\n{color}{Style.BRIGHT}{'!' * 60}{Style.RESET_ALL}")
-    print(f"{color}{Style.BRIGHT}{action:^60}{Style.RESET_ALL}")
-    print(f"{color}{Style.BRIGHT}{'!' * 60}{Style.RESET_ALL}")
+    out.append(f"\n{color}{Style.BRIGHT}{'!' * 60}{Style.RESET_ALL}")
+    out.append(f"{color}{Style.BRIGHT}{action:^60}{Style.RESET_ALL}")
+    out.append(f"{color}{Style.BRIGHT}{'!' * 60}{Style.RESET_ALL}")
     
     total_size = 0
     for item in items:
@@ -668,14 +890,15 @@ def show_delete_confirmation(item_details, use_trash=True):
         is_dir = item['is_dir']
         
         icon = "📁" if is_dir else "📄"
-        print(f"\n  {icon} {Fore.YELLOW}{Style.BRIGHT}{name}{Style.RESET_ALL}")
-        print(f"     {Fore.WHITE}Size: {humanize.naturalsize(size)}{Style.RESET_ALL}")
+        out.append(f"\n  {icon} {Fore.YELLOW}{Style.BRIGHT}{name}{Style.RESET_ALL}")
+        out.append(f"     {Fore.WHITE}Size: {naturalsize_cached(size)}{Style.RESET_ALL}")
     
-    print(f"\n{Fore.CYAN}Total: {Fore.YELLOW}{humanize.naturalsize(total_size)}{Style.RESET_ALL}")
+    out.append(f"\n{Fore.CYAN}Total: {Fore.YELLOW}{naturalsize_cached(total_size)}{Style.RESET_ALL}")
     
     if not use_trash:
-        print(f"\n{Fore.RED}{Style.BRIGHT}⚠️  This action CANNOT be undone!{Style.RESET_ALL}")
+        out.append(f"\n{Fore.RED}{Style.BRIGHT}⚠️  This action CANNOT be undone!{Style.RESET_ALL}")
     
+    _emit(out)
     confirm = input(f"\n{color}Type 'yes' to confirm: {Style.RESET_ALL}").strip().lower()
     return confirm == 'yes'
 
@@ -683,28 +906,30 @@ def show_delete_confirmation(item_details, use_trash=True):
 def show_file_preview(preview_data, file_path):
     """Display file preview."""
     clear_screen()
+    out = []
     name = os.path.basename(file_path)
     
-    print(f"\n{Fore.CYAN}{Style.BRIGHT}📄 {name}{Style.RESET_ALL}")
-    print(f"{Fore.BLUE}{'─' * 60}{Style.RESET_ALL}")
+    out.append(f"\n{Fore.CYAN}{Style.BRIGHT}📄 {name}{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 60}{Style.RESET_ALL}")
     
     ptype = preview_data.get('type', 'unknown')
     
     if ptype == 'text':
         lines = preview_data.get('content', [])
         for line in lines:
-            print(f"{Fore.WHITE}{line}{Style.RESET_ALL}")
+            out.append(f"{Fore.WHITE}{line}{Style.RESET_ALL}")
     elif ptype == 'image':
-        print(f"{Fore.GREEN}Image: {preview_data.get('format', 'Unknown')}{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}Size: {humanize.naturalsize(preview_data.get('size', 0))}{Style.RESET_ALL}")
+        out.append(f"{Fore.GREEN}Image: {preview_data.get('format', 'Unknown')}{Style.RESET_ALL}")
+        out.append(f"{Fore.WHITE}Size: {naturalsize_cached(preview_data.get('size', 0))}{Style.RESET_ALL}")
     elif ptype == 'video':
-        print(f"{Fore.GREEN}Video: {preview_data.get('format', 'Unknown')}{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}Size: {humanize.naturalsize(preview_data.get('size', 0))}{Style.RESET_ALL}")
+        out.append(f"{Fore.GREEN}Video: {preview_data.get('format', 'Unknown')}{Style.RESET_ALL}")
+        out.append(f"{Fore.WHITE}Size: {naturalsize_cached(preview_data.get('size', 0))}{Style.RESET_ALL}")
     elif ptype == 'audio':
-        print(f"{Fore.GREEN}Audio: {preview_data.get('format', 'Unknown')}{Style.RESET_ALL}")
-        print(f"{Fore.WHITE}Size: {humanize.naturalsize(preview_data.get('size', 0))}{Style.RESET_ALL}")
+        out.append(f"{Fore.GREEN}Audio: {preview_data.get('format', 'Unknown')}{Style.RESET_ALL}")
+        out.append(f"{Fore.WHITE}Size: {naturalsize_cached(preview_data.get('size', 0))}{Style.RESET_ALL}")
     else:
-        print(f"{Fore.YELLOW}Binary file: {humanize.naturalsize(preview_data.get('size', 0))}{Style.RESET_ALL}")
+        out.append(f"{Fore.YELLOW}Binary file: {naturalsize_cached(preview_data.get('size', 0))}{Style.RESET_ALL}")
     
-    print(f"{Fore.BLUE}{'─' * 60}{Style.RESET_ALL}")
+    out.append(f"{Fore.BLUE}{'─' * 60}{Style.RESET_ALL}")
+    _emit(out)
     input(f"{Fore.CYAN}Press Enter to continue...{Style.RESET_ALL}")
@@ -9,6 +9,7 @@ import threading
 import time
 import itertools
 import shutil
+import functools
 
 # Check if required packages are installed
 try:
@@ -20,12 +21,19 @@ except ImportError:
 
 try:
     from colorama import init, Fore, Back, Style
-    init(autoreset=True)  # Initialize colorama
 except ImportError:
     print("The 'colorama' package is required for colored output. Installing...")
     subprocess.check_call([sys.executable, "-m", "pip", "install", "--break-system-packages", "colorama"])
     from colorama import init, Fore, Back, Style
-    init(autoreset=True)  # Initialize colorama
+
+# A non-Windows terminal understands ANSI codes, so stdout is left unwrapped
+# there to keep every write off colorama's per-write escape-sequence scan.
+# Windows consoles and redirected output (pipes, files) keep the wrapper,
+# which converts or strips the codes respectively.
+if sys.platform != 'win32' and sys.stdout.isatty():
+    init(wrap=False)
+else:
+    init(autoreset=True)
 
 # Global variable to control the spinner
 spinner_running = False
@@ -58,7 +66,11 @@ def update_spinner_folder(folder_path):
     spinner_folder_count += 1
 
 def start_spinner(message):
-    """Start a spinner with a message."""
+    """Start a spinner with a message.
+    
+    The spinner draws from its own daemon thread, so the caller can block in
+    the slow operation itself until it calls stop_spinner().
+    """
     global spinner_running, spinner_thread, spinner_current_folder, spinner_folder_count
     spinner_running = True
     spinner_current_folder = ""
@@ -137,20 +149,104 @@ def _show_spinner(message):
     sys.stdout.flush()
 
 def get_size(path):
-    """Calculate the size of a file or directory."""
-    if os.path.isfile(path):
-        return os.path.getsize(path)
+    """Calculate the size of a file or directory.
+    
+    Symbolic links inside a directory are skipped. Sizes come from the
+    scandir entries' lstat, one call per file.
+    """
+    return get_size_capped(path, float('inf'))[0]
 
+def get_size_capped(path, cap):
+    """Calculate the size of a file or directory, stopping early past cap.
+    
+    The walk ends as soon as the running total exceeds cap, so a huge folder
+    costs no more than it takes to find out it is huge.
+    
+    Returns:
+        tuple: (size, capped) - when capped is True, size is only a lower bound
+    """
+    if os.path.isfile(path):
+        return os.path.getsize(path), False
+    
     total_size = 0
-    for dirpath, _, filenames in os.walk(path):
-        for f in filenames:
-            fp = os.path.join(dirpath, f)
-            if not os.path.islink(fp):  # Skip symbolic links
-                try:
-                    total_size += os.path.getsize(fp)
-                except (OSError, PermissionError):
-                    pass  # Skip files that can't be accessed
-    return total_size
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_symlink():
+                            continue  # Skip symbolic links, and don't descend into them
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                            if total_size > cap:
+                                return total_size, True
+                    except OSError:
+                        pass  # Skip files that can't be accessed
+        except OSError:
+            pass
+    return total_size, False
+
+# Recent directory checks: {path: (is_dir, checked_at)}
+ISDIR_TTL = 2.0
+_isdir_results = {}
+
+def isdir_cached(path):
+    """os.path.isdir that reuses answers younger than ISDIR_TTL seconds.
+    
+    Saves repeat lookups (and network round-trips) when the same path, or the
+    same bad path, is checked several times in a row.
+    """
+    now = time.monotonic()
+    cached = _isdir_results.get(path)
+    if cached is not None and now - cached[1] < ISDIR_TTL:
+        return cached[0]
+    result = os.path.isdir(path)
+    _isdir_results[path] = (result, now)
+    return result
+
+def forget_isdir(path=None):
+    """Drop cached isdir answers for path and anything under it, or all of them."""
+    if path is None:
+        _isdir_results.clear()
+        return
+    prefix = os.path.join(path, '')
+    for cached in [p for p in _isdir_results if p == path or p.startswith(prefix)]:
+        del _isdir_results[cached]
+
+# Absolute paths resolve the same whatever the working directory, so their
+# abspath can be remembered; on Windows only paths with a drive qualify
+_abspath_absolute = functools.lru_cache(maxsize=65536)(os.path.abspath)
+
+def abspath_cached(path):
+    """os.path.abspath that remembers its answers for paths that are already absolute."""
+    if os.path.isabs(path) and (os.sep == '/' or os.path.splitdrive(path)[0]):
+        return _abspath_absolute(path)
+    return os.path.abspath(path)
+
+# Decimal unit suffixes used by humanize.naturalsize, from 10**3 upwards
+_SIZE_SUFFIXES = ('kB', 'MB', 'GB', 'TB', 'PB', 'EB', 'ZB', 'YB')
+
+def fast_naturalsize(value):
+    """Format a byte count like humanize.naturalsize (e.g. '1.5 MB') without its per-call setup."""
+    magnitude = abs(value)
+    if magnitude == 1:
+        return "%d Byte" % value
+    if magnitude < 1000:
+        return "%d Bytes" % value
+    tier = 0
+    divisor = 1000
+    # Step up while the rounded figure would read 1000.0 or more
+    while magnitude >= divisor * 999.95 and tier < len(_SIZE_SUFFIXES) - 1:
+        tier += 1
+        divisor *= 1000
+    return "%.1f %s" % (value / divisor, _SIZE_SUFFIXES[tier])
+
+# Listings repeat the same sizes (empty files, 4 KB directories, ...) and every
+# redraw formats them again, so the formatted strings are remembered
+naturalsize_cached = functools.lru_cache(maxsize=4096)(fast_naturalsize)
 
 def clear_screen():
     """Clear the terminal screen."""
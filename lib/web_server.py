@@ -8,8 +8,9 @@ import json
 import threading
 import webbrowser
 from http.server import HTTPServer, SimpleHTTPRequestHandler, ThreadingHTTPServer
+from operator import itemgetter
 from urllib.parse import urlparse, parse_qs
-import humanize
+from .utils import naturalsize_cached
 
 # Reference to the cache will be set when server starts
 _cache = None
@@ -23,6 +24,10 @@ CHART_COLORS = [
     '#AC64AD', '#63FF7B', '#FF6347', '#40E0D0', '#EE82EE'
 ]
 
+# Media files are streamed to the client through one reused buffer of this size
+# instead of being read into memory whole
+MEDIA_BUFFER_SIZE = 4 << 20
+
 
 def get_folder_data(path, auto_rescan=True):
     """Get folder contents formatted for the dashboard.
@@ -68,9 +73,10 @@ def get_folder_data(path, auto_rescan=True):
             return None
     
     # Calculate totals
-    total_size = sum(item[1] for item in items)
-    file_count = sum(1 for item in items if not item[2])
-    folder_count = sum(1 for item in items if item[2])
+    # Each column is read with map/itemgetter, without a Python-level loop
+    total_size = sum(map(itemgetter(1), items))
+    folder_count = sum(map(itemgetter(2), items))
+    file_count = len(items) - folder_count
     
     # Build breadcrumbs - show full path from filesystem root
     breadcrumbs = []
@@ -102,7 +108,7 @@ def get_folder_data(path, auto_rescan=True):
             'name': name,
             'path': item_path,
             'size': size,
-            'size_human': humanize.naturalsize(size),
+            'size_human': naturalsize_cached(size),
             'percentage': round(percentage, 1),
             'is_dir': is_dir,
             'is_hidden': is_hidden,
@@ -118,7 +124,7 @@ def get_folder_data(path, auto_rescan=True):
         'path': path,
         'name': os.path.basename(path) or path,
         'total_size': total_size,
-        'total_size_human': humanize.naturalsize(total_size),
+        'total_size_human': naturalsize_cached(total_size),
         'parent': parent_path if has_parent else None,
         'scan_root': scan_root,
         'breadcrumbs': breadcrumbs,
@@ -156,7 +162,7 @@ def get_stats():
         'scan_root': scan_root,
         'scan_root_name': os.path.basename(scan_root) or scan_root,
         'total_size': total_size,
-        'total_size_human': humanize.naturalsize(total_size),
+        'total_size_human': naturalsize_cached(total_size),
         'file_count': total_files,
         'folder_count': total_folders
     }
@@ -174,15 +180,16 @@ def get_extensions(folder_path=None):
         return []
     
     stats = _cache.get_extension_stats(target_path)
-    total = sum(stats.values())
+    total = stats.total
     
     result = []
-    for ext, size in sorted(stats.items(), key=lambda x: x[1], reverse=True)[:15]:
+    # Already ordered largest first and capped at 15
+    for ext, size in stats.items():
         percentage = (size / total * 100) if total > 0 else 0
         result.append({
             'extension': ext or '(no ext)',
             'size': size,
-            'size_human': humanize.naturalsize(size),
+            'size_human': naturalsize_cached(size),
             'percentage': round(percentage, 1)
         })
     
@@ -204,7 +211,7 @@ def get_largest_files(folder_path=None, limit=20):
             'path': full_path,
             'name': name,
             'size': size,
-            'size_human': humanize.naturalsize(size),
+            'size_human': naturalsize_cached(size),
             'relative_path': rel_path,
             'mtime': mtime
         })
@@ -234,9 +241,9 @@ def get_duplicates():
         result.append({
             'files': files,
             'file_size': dup['size'],
-            'file_size_human': humanize.naturalsize(dup['size']),
+            'file_size_human': naturalsize_cached(dup['size']),
             'wasted_space': dup['wasted'],
-            'wasted_space_human': humanize.naturalsize(dup['wasted']),
+            'wasted_space_human': naturalsize_cached(dup['wasted']),
             'count': dup['count']
         })
     
@@ -250,13 +257,14 @@ def get_cache_folders():
     folders = scan_cache_folders()
     
     result = []
-    for path, name, description, size, clearable in folders:
+    for path, name, description, size, clearable, capped in folders:
         result.append({
             'path': path,
             'name': name,
             'description': description,
             'size': size,
-            'size_human': humanize.naturalsize(size),
+            'size_human': naturalsize_cached(size) + ('+' if capped else ''),
+            'capped': capped,
             'clearable': clearable
         })
     
@@ -279,7 +287,7 @@ def search_files(query):
             'path': full_path,
             'name': name,
             'size': size,
-            'size_human': humanize.naturalsize(size),
+            'size_human': naturalsize_cached(size),
             'is_dir': is_dir,
             'relative_path': rel_path
         })
@@ -436,32 +444,54 @@ class DashboardHandler(SimpleHTTPRequestHandler):
                 range_match = range_header.replace('bytes=', '').split('-')
                 start = int(range_match[0]) if range_match[0] else 0
                 end = int(range_match[1]) if range_match[1] else file_size - 1
+                end = min(end, file_size - 1)
+                length = max(0, end - start + 1)
                 
                 with open(file_path, 'rb') as f:
                     f.seek(start)
-                    content = f.read(end - start + 1)
-                
-                self.send_response(206)
-                self.send_header('Content-Type', mime_type)
-                self.send_header('Content-Length', len(content))
-                self.send_header('Content-Range', f'bytes {start}-{end}/{file_size}')
-                self.send_header('Accept-Ranges', 'bytes')
-                self.end_headers()
-                self.wfile.write(content)
+                    self.send_response(206)
+                    self.send_header('Content-Type', mime_type)
+                    self.send_header('Content-Length', length)
+                    self.send_header('Content-Range', f'bytes {start}-{end}/{file_size}')
+                    self.send_header('Accept-Ranges', 'bytes')
+                    self.end_headers()
+                    self._stream_file(f, length)
             else:
                 # Serve full file
                 with open(file_path, 'rb') as f:
-                    content = f.read()
-                
-                self.send_response(200)
-                self.send_header('Content-Type', mime_type)
-                self.send_header('Content-Length', len(content))
-                self.send_header('Accept-Ranges', 'bytes')
-                self.end_headers()
-                self.wfile.write(content)
+                    self.send_response(200)
+                    self.send_header('Content-Type', mime_type)
+                    self.send_header('Content-Length', file_size)
+                    self.send_header('Accept-Ranges', 'bytes')
+                    self.end_headers()
+                    self._stream_file(f, file_size)
         except Exception as e:
             self.send_error(500, str(e))
     
+    def _stream_file(self, f, length):
+        """Write length bytes from the file's current position to the response.
+        
+        The headers are already sent, so a failure here cannot become an error
+        response. If the read or the write fails, or the file ends before length
+        bytes (it shrank after the stat), the connection is closed instead so the
+        client sees a truncated body rather than waiting for bytes that never come.
+        """
+        buf = bytearray(min(MEDIA_BUFFER_SIZE, max(length, 1)))
+        view = memoryview(buf)
+        try:
+            while length > 0:
+                n = f.readinto(view[:min(length, len(buf))])
+                if not n:
+                    break
+                self.wfile.write(view[:n])
+                length -= n
+        except OSError:
+            # Includes BrokenPipeError/ConnectionResetError from a client that went away
+            self.close_connection = True
+            return
+        if length > 0:
+            self.close_connection = True
+    
     def do_GET(self):
         """Handle GET requests."""
         parsed = urlparse(self.path)
@@ -580,7 +610,7 @@ class DashboardHandler(SimpleHTTPRequestHandler):
                 'success': success, 
                 'message': msg,
                 'freed': freed,
-                'freed_human': humanize.naturalsize(freed) if freed else '0 B'
+                'freed_human': naturalsize_cached(freed) if freed else '0 B'
             })
         
         else: